@@ -6,33 +6,168 @@ Discovers and analyzes all videos from the channel using YouTube Data API v3.
 
 import json
 import csv
+from array import array
+import re
+import shelve
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 import argparse
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+
+# YouTube Data API v3 REST endpoint (called directly, without discovery documents)
+API_BASE_URL = 'https://www.googleapis.com/youtube/v3'
+
+# Number of videos.list detail lookups allowed in flight at once
+DETAIL_WORKERS = 10
+
+# videos.list accepts at most 50 IDs per request
+VIDEO_BATCH_SIZE = 50
+
+# Video metadata is near-immutable; cached entries are reused for 30 days
+VIDEO_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Title patterns used by analyze_content to attribute videos to tractates
+TRACTATE_PATTERNS = {
+    'Berachos': ['berachos', 'berakhot'],
+    'Shabbos': ['shabbos', 'shabbat'],
+    'Eruvin': ['eruvin'],
+    'Pesachim': ['pesachim'],
+    # Add more as needed
+}
+
+_PATTERN_TRACTATE = {pattern: tractate
+                     for tractate, patterns in TRACTATE_PATTERNS.items()
+                     for pattern in patterns}
+_TRACTATE_PRIORITY = {tractate: i for i, tractate in enumerate(TRACTATE_PATTERNS)}
+# Single alternation over every pattern, longest first, so a title is scanned once
+_TRACTATE_RE = re.compile('|'.join(
+    re.escape(pattern) for pattern in sorted(_PATTERN_TRACTATE, key=len, reverse=True)
+))
+
+# Columns of the tabular (CSV/Parquet) video export
+VIDEO_COLUMNS = ['video_id', 'title', 'published_at', 'duration', 'view_count',
+                 'like_count', 'comment_count', 'url']
+
+# Partial-response masks: ask the API only for the fields we store
+CHANNEL_FIELDS = ('items(id,snippet(title,description,publishedAt,thumbnails/medium/url,'
+                  'country,customUrl),statistics,contentDetails/relatedPlaylists/uploads)')
+PLAYLIST_FIELDS = ('items(id,snippet(title,description,publishedAt,thumbnails/medium/url),'
+                   'contentDetails/itemCount),nextPageToken')
+VIDEO_FIELDS = ('items(id,snippet(title,description,publishedAt,thumbnails/medium/url,'
+                'tags,categoryId,defaultLanguage),contentDetails/duration,'
+                'statistics(viewCount,likeCount,commentCount))')
+
+_DURATION_UNITS = {'H': 3600, 'M': 60, 'S': 1}
+
+# Videos in a series tend to carry identical tag lists; share one tuple per distinct list
+_TAG_CACHE = {}
+
+
+def _match_tractate(title_lower: str):
+    """Return the first tractate (in TRACTATE_PATTERNS order) named in a lowercased title."""
+    found = {_PATTERN_TRACTATE[m.group()] for m in _TRACTATE_RE.finditer(title_lower)}
+    if not found:
+        return None
+    return min(found, key=_TRACTATE_PRIORITY.__getitem__)
+
+
+@lru_cache(maxsize=4096)
+def _duration_seconds(duration_str: str) -> int:
+    """Parse ISO 8601 duration (PT#H#M#S) to seconds with a single character scan.
+    
+    Memoized, since many videos share the same length.
+    """
+    if not duration_str.startswith('PT'):
+        return 0
+    
+    total = 0
+    num = 0
+    for c in duration_str[2:]:
+        if '0' <= c <= '9':
+            num = num * 10 + ord(c) - 48
+        else:
+            unit = _DURATION_UNITS.get(c)
+            if unit is None:
+                break
+            total += num * unit
+            num = 0
+    
+    return total
+
+
+def _write_json(path: Path, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _dump_json_line(record) -> bytes:
+    """Serialize one record as a UTF-8 JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _parse_json(data: bytes):
+    """Parse a JSON document or JSON Lines entry, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class ChannelDiscovery:
     """Utility for discovering and analyzing YouTube channel content."""
     
-    def __init__(self, api_key: str):
-        """Initialize with YouTube Data API key."""
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+    def __init__(self, api_key: str, cache_file: str = None):
+        """Initialize with YouTube Data API key and optional on-disk video cache path."""
+        self.session = requests.Session()
+        self.session.params = {'key': api_key}
+        # One pooled connection per worker, reused across requests
+        adapter = HTTPAdapter(pool_connections=DETAIL_WORKERS + 2, pool_maxsize=DETAIL_WORKERS + 2)
+        self.session.mount('https://', adapter)
+        self.cache_file = cache_file
         self.channel_data = {}
         self.playlists = []
         self.all_videos = []
+        self.videos_file = None
+        self.video_count = 0
+        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    def _api_get(self, resource: str, **params) -> dict:
+        """Call a YouTube Data API list endpoint and return the decoded response."""
+        response = self.session.get(f"{API_BASE_URL}/{resource}", params=params, timeout=30)
+        response.raise_for_status()
+        return _parse_json(response.content)
     
     def get_channel_info(self, channel_handle: str) -> dict:
         """Get comprehensive channel information."""
         try:
             # Get channel by handle
-            response = self.youtube.channels().list(
+            response = self._api_get(
+                'channels',
                 part='id,snippet,statistics,contentDetails',
-                forHandle=channel_handle.replace('@', '')
-            ).execute()
+                forHandle=channel_handle.replace('@', ''),
+                fields=CHANNEL_FIELDS
+            )
             
-            if not response['items']:
+            if not response.get('items'):
                 print(f"Channel not found: {channel_handle}")
                 return {}
             
@@ -43,11 +178,11 @@ class ChannelDiscovery:
                 'title': channel['snippet']['title'],
                 'description': channel['snippet']['description'],
                 'published_at': channel['snippet']['publishedAt'],
-                'subscriber_count': int(channel['statistics'].get('subscriberCount', 0)),
-                'video_count': int(channel['statistics'].get('videoCount', 0)),
-                'view_count': int(channel['statistics'].get('viewCount', 0)),
+                'subscriber_count': int(channel.get('statistics', {}).get('subscriberCount', 0)),
+                'video_count': int(channel.get('statistics', {}).get('videoCount', 0)),
+                'view_count': int(channel.get('statistics', {}).get('viewCount', 0)),
                 'uploads_playlist': channel['contentDetails']['relatedPlaylists']['uploads'],
-                'thumbnail_url': channel['snippet']['thumbnails'].get('medium', {}).get('url', ''),
+                'thumbnail_url': channel['snippet'].get('thumbnails', {}).get('medium', {}).get('url', ''),
                 'country': channel['snippet'].get('country', ''),
                 'custom_url': channel['snippet'].get('customUrl', '')
             }
@@ -59,7 +194,7 @@ class ChannelDiscovery:
             
             return self.channel_data
             
-        except HttpError as e:
+        except requests.RequestException as e:
             print(f"YouTube API error: {e}")
             return {}
     
@@ -70,21 +205,23 @@ class ChannelDiscovery:
         
         try:
             while True:
-                response = self.youtube.playlists().list(
+                response = self._api_get(
+                    'playlists',
                     part='id,snippet,contentDetails',
                     channelId=channel_id,
                     maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
+                    pageToken=next_page_token,
+                    fields=PLAYLIST_FIELDS
+                )
                 
-                for playlist in response['items']:
+                for playlist in response.get('items', []):
                     playlist_data = {
                         'id': playlist['id'],
                         'title': playlist['snippet']['title'],
                         'description': playlist['snippet']['description'],
                         'published_at': playlist['snippet']['publishedAt'],
                         'video_count': playlist['contentDetails']['itemCount'],
-                        'thumbnail_url': playlist['snippet']['thumbnails'].get('medium', {}).get('url', '')
+                        'thumbnail_url': playlist['snippet'].get('thumbnails', {}).get('medium', {}).get('url', '')
                     }
                     playlists.append(playlist_data)
                 
@@ -96,80 +233,184 @@ class ChannelDiscovery:
             print(f"Found {len(playlists)} playlists")
             return playlists
             
-        except HttpError as e:
+        except requests.RequestException as e:
             print(f"Error fetching playlists: {e}")
             return []
     
     def get_all_videos(self, uploads_playlist_id: str, max_results: int = None) -> list:
         """Get all videos from the uploads playlist."""
-        videos = []
-        next_page_token = None
-        video_count = 0
-        
         try:
-            while True:
-                response = self.youtube.playlistItems().list(
-                    part='snippet,contentDetails',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-                
-                video_ids = []
-                for item in response['items']:
-                    if max_results and video_count >= max_results:
-                        break
-                    video_ids.append(item['contentDetails']['videoId'])
-                    video_count += 1
-                
-                # Get detailed video information
-                if video_ids:
-                    video_details = self.youtube.videos().list(
-                        part='snippet,contentDetails,statistics',
-                        id=','.join(video_ids)
-                    ).execute()
-                    
-                    for video in video_details['items']:
-                        video_data = {
-                            'video_id': video['id'],
-                            'title': video['snippet']['title'],
-                            'description': video['snippet']['description'],
-                            'published_at': video['snippet']['publishedAt'],
-                            'duration': video['contentDetails']['duration'],
-                            'view_count': int(video['statistics'].get('viewCount', 0)),
-                            'like_count': int(video['statistics'].get('likeCount', 0)),
-                            'comment_count': int(video['statistics'].get('commentCount', 0)),
-                            'thumbnail_url': video['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                            'tags': video['snippet'].get('tags', []),
-                            'category_id': video['snippet'].get('categoryId', ''),
-                            'default_language': video['snippet'].get('defaultLanguage', ''),
-                            'url': f"https://www.youtube.com/watch?v={video['id']}"
-                        }
-                        videos.append(video_data)
-                
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token or (max_results and video_count >= max_results):
-                    break
+            videos = []
+            for batch_videos in self._iter_video_batches(uploads_playlist_id, max_results):
+                videos.extend(batch_videos)
             
             self.all_videos = videos
+            self.videos_file = None
+            self.video_count = len(videos)
             print(f"Found {len(videos)} videos")
             return videos
             
-        except HttpError as e:
+        except requests.RequestException as e:
             print(f"Error fetching videos: {e}")
             return []
     
+    def stream_all_videos(self, uploads_playlist_id: str, jsonl_path: Path,
+                          max_results: int = None) -> int:
+        """Write all videos from the uploads playlist to a JSON Lines file.
+        
+        Each batch is written as it arrives instead of being held in
+        self.all_videos; later steps read the videos back via iter_videos().
+        If the listing fails part way, the partial file is removed and the
+        error is re-raised, so a truncated listing is never reported.
+        """
+        jsonl_path = Path(jsonl_path)
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        video_count = 0
+        
+        try:
+            with open(jsonl_path, 'wb') as f:
+                for batch_videos in self._iter_video_batches(uploads_playlist_id, max_results):
+                    for video_data in batch_videos:
+                        f.write(_dump_json_line(video_data))
+                    video_count += len(batch_videos)
+        except requests.RequestException as e:
+            print(f"Error fetching videos: {e}")
+            jsonl_path.unlink(missing_ok=True)
+            raise
+        
+        self.all_videos = []
+        self.videos_file = jsonl_path
+        self.video_count = video_count
+        print(f"Found {video_count} videos (streamed to {jsonl_path})")
+        return video_count
+    
+    def iter_videos(self):
+        """Iterate over discovered videos, whether held in memory or streamed to disk."""
+        if self.videos_file is None:
+            yield from self.all_videos
+            return
+        
+        with open(self.videos_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _parse_json(line)
+    
+    def _iter_video_batches(self, playlist_id: str, max_results: int = None):
+        """Yield detailed video dicts for a playlist, one 50-video batch at a time.
+        
+        Video IDs are enumerated first with a minimal playlistItems request,
+        then detail lookups for IDs missing from the video cache are issued
+        on a worker pool.
+        """
+        video_ids = self._list_playlist_video_ids(playlist_id, max_results)
+        batches = [video_ids[i:i + VIDEO_BATCH_SIZE]
+                   for i in range(0, len(video_ids), VIDEO_BATCH_SIZE)]
+        
+        if not self.cache_file:
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                # map() yields in submission order, preserving upload ordering
+                yield from executor.map(self._fetch_video_details, batches)
+            return
+        
+        cache_hits = 0
+        with shelve.open(self.cache_file) as cache, \
+                ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            now = time.time()
+            cached_batches = []
+            pending = []
+            for batch in batches:
+                cached = {}
+                for video_id in batch:
+                    entry = cache.get(video_id)
+                    if entry and now - entry['cached_at'] < VIDEO_CACHE_TTL_SECONDS:
+                        cached[video_id] = entry['video']
+                missing = [video_id for video_id in batch if video_id not in cached]
+                cached_batches.append(cached)
+                pending.append(executor.submit(self._fetch_video_details, missing) if missing else None)
+                cache_hits += len(cached)
+            
+            # The shelf is only touched from this thread; workers just fetch
+            for batch, cached, future in zip(batches, cached_batches, pending):
+                found = dict(cached)
+                if future is not None:
+                    for video_data in future.result():
+                        cache[video_data['video_id']] = {'cached_at': now, 'video': video_data}
+                        found[video_data['video_id']] = video_data
+                yield [found[video_id] for video_id in batch if video_id in found]
+        
+        print(f"Video cache: {cache_hits} of {len(video_ids)} videos served from {self.cache_file}")
+    
+    def _list_playlist_video_ids(self, playlist_id: str, max_results: int = None) -> list:
+        """List video IDs in a playlist, requesting only the ID field of each item."""
+        video_ids = []
+        next_page_token = None
+        
+        while True:
+            response = self._api_get(
+                'playlistItems',
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=next_page_token,
+                fields='items/contentDetails/videoId,nextPageToken'
+            )
+            
+            for item in response.get('items', []):
+                if max_results and len(video_ids) >= max_results:
+                    break
+                video_ids.append(item['contentDetails']['videoId'])
+            
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token or (max_results and len(video_ids) >= max_results):
+                break
+        
+        return video_ids
+    
+    def _fetch_video_details(self, video_ids: list) -> list:
+        """Fetch detailed information for up to 50 videos in one request."""
+        video_details = self._api_get(
+            'videos',
+            part='snippet,contentDetails,statistics',
+            id=','.join(video_ids),
+            fields=VIDEO_FIELDS
+        )
+        
+        videos = []
+        for video in video_details.get('items', []):
+            # Masked responses omit objects whose selected fields are all absent
+            statistics = video.get('statistics', {})
+            tags = tuple(video['snippet'].get('tags', ()))
+            video_data = {
+                'video_id': video['id'],
+                'title': video['snippet']['title'],
+                'description': video['snippet']['description'],
+                'published_at': video['snippet']['publishedAt'],
+                'duration': video['contentDetails']['duration'],
+                'duration_seconds': _duration_seconds(video['contentDetails']['duration']),
+                'view_count': int(statistics.get('viewCount', 0)),
+                'like_count': int(statistics.get('likeCount', 0)),
+                'comment_count': int(statistics.get('commentCount', 0)),
+                'thumbnail_url': video['snippet'].get('thumbnails', {}).get('medium', {}).get('url', ''),
+                'tags': _TAG_CACHE.setdefault(tags, tags),
+                'category_id': sys.intern(video['snippet'].get('categoryId', '')),
+                'default_language': sys.intern(video['snippet'].get('defaultLanguage', '')),
+                'url': f"https://www.youtube.com/watch?v={video['id']}"
+            }
+            videos.append(video_data)
+        
+        return videos
+    
     def analyze_content(self) -> dict:
         """Analyze channel content patterns."""
-        if not self.all_videos:
+        if not self.video_count:
             return {}
         
+        tractate_counts = Counter()
+        series_counts = Counter()
+        
         analysis = {
-            'total_videos': len(self.all_videos),
-            'date_range': {
-                'earliest': min(v['published_at'] for v in self.all_videos),
-                'latest': max(v['published_at'] for v in self.all_videos)
-            },
+            'total_videos': self.video_count,
+            'date_range': {},
             'tractate_breakdown': {},
             'series_patterns': {},
             'duration_stats': {},
@@ -177,165 +418,219 @@ class ChannelDiscovery:
             'upload_frequency': {}
         }
         
-        # Analyze tractates
-        tractate_patterns = {
-            'Berachos': ['berachos', 'berakhot'],
-            'Shabbos': ['shabbos', 'shabbat'],
-            'Eruvin': ['eruvin'],
-            'Pesachim': ['pesachim'],
-            # Add more as needed
-        }
+        # Gathered in a single pass; durations and views go into compact
+        # int64 buffers that NumPy reduces without copying
+        video_total = 0
+        earliest = latest = None
+        durations = array('q')
+        views = array('q')
         
-        for video in self.all_videos:
+        for video in self.iter_videos():
+            video_total += 1
+            
+            published_at = video['published_at']
+            if earliest is None or published_at < earliest:
+                earliest = published_at
+            if latest is None or published_at > latest:
+                latest = published_at
+            
+            # Older cache/stream entries may predate the pre-parsed field
+            duration = video.get('duration_seconds')
+            if duration is None:
+                duration = self.parse_duration(video['duration'])
+            durations.append(duration)
+            views.append(video['view_count'])
+            
             title_lower = video['title'].lower()
             
             # Tractate analysis
-            for tractate, patterns in tractate_patterns.items():
-                if any(pattern in title_lower for pattern in patterns):
-                    analysis['tractate_breakdown'][tractate] = analysis['tractate_breakdown'].get(tractate, 0) + 1
-                    break
-            else:
-                analysis['tractate_breakdown']['Other'] = analysis['tractate_breakdown'].get('Other', 0) + 1
+            tractate = _match_tractate(title_lower) or 'Other'
+            tractate_counts[tractate] += 1
             
             # Series pattern analysis
             if 'daf yomi' in title_lower:
-                analysis['series_patterns']['Daf Yomi'] = analysis['series_patterns'].get('Daf Yomi', 0) + 1
+                series_counts['Daf Yomi'] += 1
             elif 'shiur' in title_lower:
-                analysis['series_patterns']['Shiur'] = analysis['series_patterns'].get('Shiur', 0) + 1
+                series_counts['Shiur'] += 1
             else:
-                analysis['series_patterns']['Other'] = analysis['series_patterns'].get('Other', 0) + 1
+                series_counts['Other'] += 1
+        
+        if not video_total:
+            return {}
+        
+        analysis['tractate_breakdown'] = dict(tractate_counts)
+        analysis['series_patterns'] = dict(series_counts)
+        analysis['date_range'] = {
+            'earliest': earliest,
+            'latest': latest
+        }
         
         # Duration and view statistics
-        durations = [self.parse_duration(v['duration']) for v in self.all_videos]
-        views = [v['view_count'] for v in self.all_videos]
+        duration_arr = np.frombuffer(durations, dtype=np.int64)
+        view_arr = np.frombuffer(views, dtype=np.int64)
         
         analysis['duration_stats'] = {
-            'average_seconds': sum(durations) / len(durations),
-            'min_seconds': min(durations),
-            'max_seconds': max(durations),
-            'total_hours': sum(durations) / 3600
+            'average_seconds': float(duration_arr.mean()),
+            'min_seconds': int(duration_arr.min()),
+            'max_seconds': int(duration_arr.max()),
+            'total_hours': int(duration_arr.sum()) / 3600
         }
         
         analysis['view_stats'] = {
-            'total_views': sum(views),
-            'average_views': sum(views) / len(views),
-            'min_views': min(views),
-            'max_views': max(views)
+            'total_views': int(view_arr.sum()),
+            'average_views': float(view_arr.mean()),
+            'min_views': int(view_arr.min()),
+            'max_views': int(view_arr.max())
         }
         
         return analysis
     
     def parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration to seconds."""
-        import re
-        
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        
-        if not match:
-            return 0
-        
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-        
-        return hours * 3600 + minutes * 60 + seconds
+        return _duration_seconds(duration_str)
     
-    def save_discovery_report(self, output_dir: str = "channel_discovery"):
-        """Save comprehensive discovery report."""
+    def save_discovery_report(self, output_dir: str = "channel_discovery", table_format: str = "csv"):
+        """Save comprehensive discovery report.
+        
+        table_format selects the tabular video export: 'csv', 'parquet' or
+        'both'. The report files are independent, so they are written
+        concurrently.
+        """
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = self.timestamp
+        analysis = self.analyze_content()
         
-        # Save channel info
-        with open(output_path / f"channel_info_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(self.channel_data, f, indent=2, ensure_ascii=False)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            writes = [
+                # Save channel info
+                executor.submit(_write_json, output_path / f"channel_info_{timestamp}.json", self.channel_data),
+                # Save playlists
+                executor.submit(_write_json, output_path / f"playlists_{timestamp}.json", self.playlists),
+                # Save analysis
+                executor.submit(_write_json, output_path / f"content_analysis_{timestamp}.json", analysis),
+                # Save summary report
+                executor.submit(self._write_summary, output_path / f"discovery_summary_{timestamp}.txt", analysis)
+            ]
+            
+            # Save all videos as JSON (already on disk as JSON Lines when streamed)
+            if self.videos_file is None:
+                writes.append(executor.submit(
+                    _write_json, output_path / f"all_videos_{timestamp}.json", self.all_videos))
+            
+            # Save videos as CSV and/or Parquet
+            if self.video_count and table_format in ('csv', 'both'):
+                writes.append(executor.submit(self._write_videos_csv, output_path / f"all_videos_{timestamp}.csv"))
+            if self.video_count and table_format in ('parquet', 'both'):
+                writes.append(executor.submit(self._write_videos_parquet, output_path / f"all_videos_{timestamp}.parquet"))
+            
+            # Surface any write error
+            for write in writes:
+                write.result()
         
-        # Save playlists
-        with open(output_path / f"playlists_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(self.playlists, f, indent=2, ensure_ascii=False)
+        print(f"Discovery report saved to: {output_path}")
+    
+    def _write_videos_csv(self, path: Path):
+        """Write the discovered videos as CSV."""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(VIDEO_COLUMNS)
+            writer.writerows(
+                (video['video_id'], video['title'], video['published_at'], video['duration'],
+                 video['view_count'], video.get('like_count', ''), video.get('comment_count', ''),
+                 video['url'])
+                for video in self.iter_videos()
+            )
+    
+    def _write_videos_parquet(self, path: Path):
+        """Write the discovered videos as zstd-compressed Parquet (requires pyarrow)."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("pyarrow is not installed; skipping Parquet export (pip install pyarrow)")
+            return
         
-        # Save all videos as JSON
-        with open(output_path / f"all_videos_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(self.all_videos, f, indent=2, ensure_ascii=False)
+        columns = {name: [] for name in VIDEO_COLUMNS}
+        for video in self.iter_videos():
+            for name in VIDEO_COLUMNS:
+                columns[name].append(video.get(name))
         
-        # Save videos as CSV
-        if self.all_videos:
-            with open(output_path / f"all_videos_{timestamp}.csv", 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['video_id', 'title', 'published_at', 'duration', 'view_count', 
-                             'like_count', 'comment_count', 'url']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for video in self.all_videos:
-                    row = {field: video.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
+        pq.write_table(pa.table(columns), path, compression='zstd')
+    
+    def _write_summary(self, path: Path, analysis: dict):
+        """Write the human-readable discovery summary in a single write."""
+        lines = [
+            "MERCAZ DAF YOMI CHANNEL DISCOVERY REPORT",
+            "=" * 50,
+            "",
+            f"Discovery Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Channel: {self.channel_data.get('title', 'Unknown')}",
+            f"Channel ID: {self.channel_data.get('id', 'Unknown')}",
+            f"Subscribers: {self.channel_data.get('subscriber_count', 0):,}",
+            f"Total Videos Found: {self.video_count}",
+            f"Total Playlists: {len(self.playlists)}",
+            ""
+        ]
         
-        # Save analysis
-        analysis = self.analyze_content()
-        with open(output_path / f"content_analysis_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2, ensure_ascii=False)
-        
-        # Save summary report
-        with open(output_path / f"discovery_summary_{timestamp}.txt", 'w', encoding='utf-8') as f:
-            f.write("MERCAZ DAF YOMI CHANNEL DISCOVERY REPORT\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Discovery Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Channel: {self.channel_data.get('title', 'Unknown')}\n")
-            f.write(f"Channel ID: {self.channel_data.get('id', 'Unknown')}\n")
-            f.write(f"Subscribers: {self.channel_data.get('subscriber_count', 0):,}\n")
-            f.write(f"Total Videos Found: {len(self.all_videos)}\n")
-            f.write(f"Total Playlists: {len(self.playlists)}\n\n")
+        if analysis:
+            lines += [
+                "CONTENT ANALYSIS:",
+                "-" * 20,
+                f"Date Range: {analysis['date_range']['earliest']} to {analysis['date_range']['latest']}",
+                f"Total Content Hours: {analysis['duration_stats']['total_hours']:.1f}",
+                f"Average Video Length: {analysis['duration_stats']['average_seconds']/60:.1f} minutes",
+                f"Total Views: {analysis['view_stats']['total_views']:,}",
+                f"Average Views per Video: {analysis['view_stats']['average_views']:,.0f}",
+                "",
+                "TRACTATE BREAKDOWN:",
+                "-" * 20
+            ]
+            lines += [f"{tractate}: {count} videos"
+                      for tractate, count in sorted(analysis['tractate_breakdown'].items())]
             
-            if analysis:
-                f.write("CONTENT ANALYSIS:\n")
-                f.write("-" * 20 + "\n")
-                f.write(f"Date Range: {analysis['date_range']['earliest']} to {analysis['date_range']['latest']}\n")
-                f.write(f"Total Content Hours: {analysis['duration_stats']['total_hours']:.1f}\n")
-                f.write(f"Average Video Length: {analysis['duration_stats']['average_seconds']/60:.1f} minutes\n")
-                f.write(f"Total Views: {analysis['view_stats']['total_views']:,}\n")
-                f.write(f"Average Views per Video: {analysis['view_stats']['average_views']:,.0f}\n\n")
-                
-                f.write("TRACTATE BREAKDOWN:\n")
-                f.write("-" * 20 + "\n")
-                for tractate, count in sorted(analysis['tractate_breakdown'].items()):
-                    f.write(f"{tractate}: {count} videos\n")
-                
-                f.write(f"\nSERIES PATTERNS:\n")
-                f.write("-" * 20 + "\n")
-                for series, count in sorted(analysis['series_patterns'].items()):
-                    f.write(f"{series}: {count} videos\n")
+            lines += ["", "SERIES PATTERNS:", "-" * 20]
+            lines += [f"{series}: {count} videos"
+                      for series, count in sorted(analysis['series_patterns'].items())]
         
-        print(f"Discovery report saved to: {output_path}")
+        lines.append("")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
 
 
-def main():
-    """Main entry point."""
+def main(argv=None):
+    """Main entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(description="Discover and analyze Mercaz Daf Yomi channel")
     parser.add_argument('--api-key', required=True, help='YouTube Data API v3 key')
     parser.add_argument('--channel', default='@MercazDafYomi', help='Channel handle')
     parser.add_argument('--max-videos', type=int, help='Maximum videos to analyze')
     parser.add_argument('--output-dir', default='channel_discovery', help='Output directory')
+    parser.add_argument('--format', choices=['csv', 'parquet', 'both'], default='csv',
+                        help='Tabular export format for the video list (parquet requires pyarrow)')
+    parser.add_argument('--cache-file', default='.yt_cache',
+                        help='On-disk cache of video metadata (entries kept for 30 days)')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch video metadata from the API')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
-        discovery = ChannelDiscovery(args.api_key)
+        discovery = ChannelDiscovery(args.api_key, None if args.no_cache else args.cache_file)
         
         # Get channel info
         channel_info = discovery.get_channel_info(args.channel)
         if not channel_info:
-            return
-        
-        # Get playlists
-        discovery.get_all_playlists(channel_info['id'])
+            sys.exit(1)
         
-        # Get all videos
-        discovery.get_all_videos(channel_info['uploads_playlist'], args.max_videos)
+        # Get playlists alongside all videos; videos are streamed to disk as they arrive
+        videos_file = Path(args.output_dir) / f"all_videos_{discovery.timestamp}.jsonl"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            playlists = executor.submit(discovery.get_all_playlists, channel_info['id'])
+            discovery.stream_all_videos(channel_info['uploads_playlist'], videos_file, args.max_videos)
+            playlists.result()
         
         # Save report
-        discovery.save_discovery_report(args.output_dir)
+        discovery.save_discovery_report(args.output_dir, args.format)
         
         print("Channel discovery completed successfully!")
         
@@ -343,6 +638,7 @@ def main():
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -5,14 +5,77 @@ Organizes extracted transcripts into proper directory structure and generates re
 """
 
 import os
+import sys
 import json
 import csv
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import re
+import string
 import argparse
+import numpy as np
+import hashlib
+import mmap
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # Optional: falls back to hashlib.blake2b
+    blake3 = None
+
+# Classification text normalization: ASCII lowercase, with underscores read as spaces
+# so "bava_kamma" and "Bava Kamma" match the same pattern
+_NORMALIZE_TABLE = str.maketrans({'_': ' ', **{c: c.lower() for c in string.ascii_uppercase}})
+
+# Upper bound on threads used to write tractate indexes in parallel
+INDEX_WORKERS = 8
+
+# Threads used to create the directory structure
+MKDIR_WORKERS = 16
+
+# Bytes read from the start of a transcript when looking for its title line
+TITLE_READ_BYTES = 2048
+
+# Persistent title/classification cache, kept under Reports/ so walks skip it
+CACHE_FILENAME = ".organizer_cache.json"
+
+# Threads used to hash transcript files during duplicate detection
+HASH_WORKERS = 8
+
+# Threads used to stat transcripts and read their title lines before classification
+TITLE_WORKERS = 8
+
+
+def _write_json(path, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _file_digest(path: str) -> bytes:
+    """Return a content digest of the file at path, using multi-threaded blake3 when installed."""
+    if blake3 is not None:
+        digest = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        digest.update_mmap(path)
+        return digest.digest()
+    
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
 
 
 class ContentOrganizer:
@@ -30,10 +93,10 @@ class ContentOrganizer:
             "Yoma": ["yoma"],
             "Sukkah": ["sukkah"],
             "Beitzah": ["beitzah", "beitza"],
-            "Rosh_Hashanah": ["rosh hashanah", "rosh_hashanah"],
+            "Rosh_Hashanah": ["rosh hashanah"],
             "Taanis": ["taanis", "taanit"],
             "Megillah": ["megillah"],
-            "Moed_Katan": ["moed katan", "moed_katan"],
+            "Moed_Katan": ["moed katan"],
             "Chagigah": ["chagigah"],
             "Yevamos": ["yevamos", "yevamot"],
             "Kesubos": ["kesubos", "ketubbot"],
@@ -42,13 +105,13 @@ class ContentOrganizer:
             "Sotah": ["sotah"],
             "Gittin": ["gittin"],
             "Kiddushin": ["kiddushin"],
-            "Bava_Kamma": ["bava kamma", "bava_kamma"],
-            "Bava_Metzia": ["bava metzia", "bava_metzia"],
-            "Bava_Basra": ["bava basra", "bava_basra"],
+            "Bava_Kamma": ["bava kamma"],
+            "Bava_Metzia": ["bava metzia"],
+            "Bava_Basra": ["bava basra"],
             "Sanhedrin": ["sanhedrin"],
             "Makkos": ["makkos", "makkot"],
             "Shevuos": ["shevuos", "shevuot"],
-            "Avodah_Zarah": ["avodah zarah", "avodah_zarah"],
+            "Avodah_Zarah": ["avodah zarah"],
             "Horayos": ["horayos", "horayot"],
             "Zevachim": ["zevachim"],
             "Menachos": ["menachos", "menachot"],
@@ -71,62 +134,197 @@ class ContentOrganizer:
             "Special_Series": ["special", "event", "announcement"],
             "General": []
         }
+        
+        # Any of these moves content to Special_Series/Events, overriding other matches
+        self.event_patterns = ["special", "event", "announcement"]
+        
+        self._build_classifier()
+        
+        # Directories never descended into when walking the tree
+        self._skip_dirs = frozenset({"Logs", "Reports", ".git"})
+        
+        # Absolute path -> {mtime_ns, size, title[, tractate, series]}, persisted
+        # across runs; files are read and classified again only if they change
+        self.cache_file = self.base_dir / "Reports" / CACHE_FILENAME
+        self._cache = self._load_cache()
+        self._cache_dirty = False
+    
+    def _build_classifier(self):
+        """Precompile every classification pattern into one regex with a named group per label."""
+        def alternation(patterns):
+            normalized = {p.translate(_NORMALIZE_TABLE) for p in patterns}
+            return '|'.join(re.escape(p) for p in sorted(normalized, key=lambda p: (-len(p), p)))
+        
+        groups = [f"(?P<E>{alternation(self.event_patterns)})"]
+        groups += [f"(?P<T_{name}>{alternation(patterns)})"
+                   for name, patterns in self.tractate_patterns.items() if patterns]
+        groups += [f"(?P<S_{name}>{alternation(patterns)})"
+                   for name, patterns in self.series_types.items() if patterns]
+        
+        # The zero-width lookahead reports a hit at every position, so
+        # overlapping mentions are seen just as plain substring tests would
+        self._classify_re = re.compile(f"(?=(?:{'|'.join(groups)}))")
+        # The same scan over UTF-8 bytes, for batches: one wide character
+        # would otherwise widen a whole joined str buffer and slow the scan
+        self._classify_bytes_re = re.compile(self._classify_re.pattern.encode('utf-8'))
+        self._classifier_signature = hashlib.blake2b(self._classify_re.pattern.encode('utf-8'),
+                                                     digest_size=8).hexdigest()
+        self._tractate_rank = {name: i for i, name in enumerate(self.tractate_patterns)}
+        self._series_rank = {name: i for i, name in enumerate(self.series_types)}
+    
+    def _load_cache(self) -> Dict:
+        """Load the persistent title/classification cache, or start empty."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = f.read()
+            cache = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+        
+        files = cache.get('files', {})
+        if cache.get('classifier') != self._classifier_signature:
+            # Patterns changed since the cache was written; titles are still valid
+            for entry in files.values():
+                entry.pop('tractate', None)
+                entry.pop('series', None)
+        return files
+    
+    def save_cache(self):
+        """Write the title/classification cache if anything changed this run."""
+        if not self._cache_dirty:
+            return
+        
+        cache = {'classifier': self._classifier_signature, 'files': self._cache}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            with open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps(cache))
+        else:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        self._cache_dirty = False
+    
+    def _file_entry(self, file_path: Path) -> Dict:
+        """Return the cache entry for file_path, re-reading its title if the file changed."""
+        key = os.path.abspath(file_path)
+        st = os.stat(key)
+        entry = self._cache.get(key)
+        if entry is None or entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+            entry = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'title': self._read_title(key, st.st_size, file_path.stem)
+            }
+            self._cache[key] = entry
+            self._cache_dirty = True
+        return entry
+    
+    def _try_file_entry(self, file_path: Path):
+        """Return the cache entry for file_path, or None if it can't be read."""
+        try:
+            return self._file_entry(file_path)
+        except Exception:
+            return None
+    
+    def _classify_files(self, file_paths: List[Path], fallback_to_stem: bool = False) -> List[Tuple[str, str]]:
+        """Classify files by their titles, reusing cached classifications of unchanged files."""
+        results = [None] * len(file_paths)
+        miss_indexes = []
+        miss_titles = []
+        miss_entries = []
+        
+        # Stat files and read changed titles on a pool; each file only touches its own cache key
+        with ThreadPoolExecutor(max_workers=TITLE_WORKERS) as executor:
+            entries = list(executor.map(self._try_file_entry, file_paths))
+        
+        for i, (file_path, entry) in enumerate(zip(file_paths, entries)):
+            title = entry['title'] if entry is not None else file_path.stem
+            
+            if fallback_to_stem and not title:
+                # Classified by file name; not the cached title's classification
+                entry = None
+                title = file_path.stem
+            elif entry is not None and 'tractate' in entry:
+                results[i] = (entry['tractate'], entry['series'])
+                continue
+            
+            miss_indexes.append(i)
+            miss_titles.append(title)
+            miss_entries.append(entry)
+        
+        for i, entry, labels in zip(miss_indexes, miss_entries, self.classify_many(miss_titles)):
+            results[i] = labels
+            if entry is not None:
+                entry['tractate'], entry['series'] = labels
+                self._cache_dirty = True
+        
+        return results
     
     def create_directory_structure(self):
         """Create the organized directory structure."""
         print("Creating directory structure...")
         
-        # Create base directory
-        self.base_dir.mkdir(exist_ok=True)
+        # Leaf directories only; parents=True creates the tractate and base levels
+        targets = {self.base_dir / tractate / series_type
+                   for tractate in self.tractate_patterns
+                   for series_type in self.series_types}
         
-        # Create tractate directories
-        for tractate in self.tractate_patterns.keys():
-            tractate_dir = self.base_dir / tractate
-            tractate_dir.mkdir(exist_ok=True)
-            
-            # Create series subdirectories
-            for series_type in self.series_types.keys():
-                series_dir = tractate_dir / series_type
-                series_dir.mkdir(exist_ok=True)
-        
-        # Create special directories
-        special_dirs = ["Unclassified", "Special_Series", "Logs", "Reports"]
-        for special_dir in special_dirs:
-            (self.base_dir / special_dir).mkdir(exist_ok=True)
-            
-            # Create series subdirectories for special dirs
-            if special_dir in ["Unclassified", "Special_Series"]:
-                for series_type in self.series_types.keys():
-                    (self.base_dir / special_dir / series_type).mkdir(exist_ok=True)
+        # Special directories, with series subdirectories for the content-holding ones
+        targets |= {self.base_dir / special_dir / series_type
+                    for special_dir in ["Unclassified", "Special_Series"]
+                    for series_type in self.series_types}
+        targets |= {self.base_dir / special_dir for special_dir in ["Logs", "Reports"]}
+        
+        with ThreadPoolExecutor(max_workers=MKDIR_WORKERS) as executor:
+            list(executor.map(lambda path: path.mkdir(parents=True, exist_ok=True), targets))
         
         print(f"Directory structure created in: {self.base_dir}")
     
     def classify_content(self, title: str, description: str = "") -> Tuple[str, str]:
         """Classify content by tractate and series type."""
-        title_lower = title.lower()
-        description_lower = description.lower()
-        combined_text = f"{title_lower} {description_lower}"
-        
-        # Find tractate
-        tractate = "Unclassified"
-        for tract_name, patterns in self.tractate_patterns.items():
-            if any(pattern in combined_text for pattern in patterns):
-                tractate = tract_name
-                break
-        
-        # Find series type
-        series_type = "General"
-        for series_name, patterns in self.series_types.items():
-            if patterns and any(pattern in combined_text for pattern in patterns):
-                series_type = series_name
-                break
-        
-        # Special handling for certain patterns
-        if any(word in combined_text for word in ['special', 'event', 'announcement']):
-            tractate = "Special_Series"
-            series_type = "Events"
-        
-        return tractate, series_type
+        # Lowercase and fold underscores to spaces in a single C-level pass
+        combined_text = f"{title} {description}".translate(_NORMALIZE_TABLE)
+        
+        return self._labels_from_hits(match.lastgroup for match in self._classify_re.finditer(combined_text))
+    
+    def classify_many(self, titles: List[str]) -> List[Tuple[str, str]]:
+        """Classify many titles with one regex scan over a joined buffer.
+        
+        Equivalent to [classify_content(title) for title in titles].
+        """
+        texts = [f"{title} ".translate(_NORMALIZE_TABLE).encode('utf-8', 'surrogatepass') for title in titles]
+        buffer = b'\x00'.join(texts)
+        
+        # Offset just past each text's separator; a hit belongs to the first text ending after it
+        ends = np.cumsum([len(text) + 1 for text in texts])
+        hits = [(match.start(), match.lastgroup) for match in self._classify_bytes_re.finditer(buffer)]
+        
+        groups_by_title = [[] for _ in texts]
+        if hits:
+            owners = np.searchsorted(ends, [start for start, _ in hits], side='right')
+            for owner, (_, group) in zip(owners.tolist(), hits):
+                groups_by_title[owner].append(group)
+        
+        return [self._labels_from_hits(groups) for groups in groups_by_title]
+    
+    def _labels_from_hits(self, groups) -> Tuple[str, str]:
+        """Reduce classifier group hits for one text to (tractate, series_type)."""
+        # Keep the highest-priority (first listed) tractate and series,
+        # as checking the tables in order would
+        tractate = None
+        series_type = None
+        for group in groups:
+            if group == 'E':
+                # Special handling for certain patterns
+                return "Special_Series", "Events"
+            name = group[2:]
+            if group[0] == 'T':
+                if tractate is None or self._tractate_rank[name] < self._tractate_rank[tractate]:
+                    tractate = name
+            elif series_type is None or self._series_rank[name] < self._series_rank[series_type]:
+                series_type = name
+        
+        return tractate or "Unclassified", series_type or "General"
     
     def organize_existing_files(self, source_directory: str = None):
         """Organize existing transcript files into proper structure."""
@@ -141,28 +339,27 @@ class ContentOrganizer:
         
         print(f"Organizing files from: {source_path}")
         
-        # Find all transcript files
-        transcript_files = []
-        for ext in ['*.txt', '*.json']:
-            transcript_files.extend(source_path.glob(f"**/{ext}"))
+        # Find all transcript files (.txt first, then .json)
+        found = {'.txt': [], '.json': []}
+        self._collect_files(str(source_path), found)
+        transcript_files = found['.txt'] + found['.json']
         
         organized_count = 0
         failed_count = 0
         
-        for file_path in transcript_files:
+        # Skip files already in the organized structure
+        pending = []
+        for path in transcript_files:
+            file_path = Path(path)
+            if len(file_path.parts) > 2 and file_path.parts[-3] in self.tractate_patterns:
+                continue
+            pending.append(file_path)
+        
+        # Classify by title from file content, falling back to the filename
+        classifications = self._classify_files(pending, fallback_to_stem=True)
+        
+        for file_path, (tractate, series_type) in zip(pending, classifications):
             try:
-                # Skip if already in organized structure
-                if len(file_path.parts) > 2 and file_path.parts[-3] in self.tractate_patterns:
-                    continue
-                
-                # Extract title from filename or file content
-                title = self.extract_title_from_file(file_path)
-                if not title:
-                    title = file_path.stem
-                
-                # Classify content
-                tractate, series_type = self.classify_content(title)
-                
                 # Create target directory
                 target_dir = self.base_dir / tractate / series_type
                 target_dir.mkdir(parents=True, exist_ok=True)
@@ -171,6 +368,12 @@ class ContentOrganizer:
                 target_path = target_dir / file_path.name
                 if target_path != file_path:
                     shutil.move(str(file_path), str(target_path))
+                    
+                    # The move keeps content and mtime, so the cache entry follows the file
+                    entry = self._cache.pop(os.path.abspath(file_path), None)
+                    if entry is not None:
+                        self._cache[os.path.abspath(target_path)] = entry
+                        self._cache_dirty = True
                     organized_count += 1
                     print(f"Moved: {file_path.name} -> {tractate}/{series_type}/")
                 
@@ -180,27 +383,116 @@ class ContentOrganizer:
         
         print(f"Organization complete: {organized_count} files organized, {failed_count} failed")
     
+    def _collect_files(self, path: str, found: Dict[str, List[str]]):
+        """Append every file under path whose extension is a key of found, depth-first."""
+        for _, entry in self._iter_tree(path):
+            if entry.is_file():
+                ext = os.path.splitext(entry.name)[1]
+                if ext in found:
+                    found[ext].append(entry.path)
+    
     def extract_title_from_file(self, file_path: Path) -> str:
-        """Extract title from transcript file."""
+        """Extract title from transcript file (cached until the file changes)."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                first_lines = f.read(500)  # Read first 500 characters
-                
-                # Look for title line
-                for line in first_lines.split('\n'):
-                    if line.startswith('Title:'):
-                        return line.replace('Title:', '').strip()
-                    elif line.startswith('Video:'):
-                        return line.replace('Video:', '').strip()
-                
-                # Fallback to filename
-                return file_path.stem
-                
+            return self._file_entry(file_path)['title']
         except Exception:
             return file_path.stem
     
+    def _read_title(self, path: str, size: int, default: str) -> str:
+        """Read the Title:/Video: header line of a transcript, or return default."""
+        title = default
+        if size:
+            # Scan the header lines straight from the page cache, decoding
+            # only the line that matches
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    limit = min(len(mm), TITLE_READ_BYTES)
+                    pos = 0
+                    while pos < limit:
+                        end = mm.find(b'\n', pos, limit)
+                        if end < 0:
+                            end = limit
+                        if mm[pos:pos + 6] in (b'Title:', b'Video:'):
+                            title = mm[pos + 6:end].decode('utf-8', 'ignore').strip()
+                            break
+                        pos = end + 1
+            finally:
+                os.close(fd)
+        return title
+    
+    def _walk_once(self) -> Dict:
+        """Walk base_dir once, collecting what inventory, validation and indexes need.
+        
+        Returns a dict with:
+          'tree': {tractate: {series: {'entry_count': n, 'files': [(name, path, size)],
+                                       'total_size': bytes, 'file_types': Counter}}}
+          'txt_files': [(path, size)] for every .txt file at any depth
+        """
+        walk = {'tree': {}, 'txt_files': []}
+        
+        for rel_parts, entry in self._iter_tree():
+            depth = len(rel_parts)
+            if entry.is_dir(follow_symlinks=False):
+                if depth == 0:
+                    walk['tree'][entry.name] = {}
+                elif depth == 1:
+                    walk['tree'][rel_parts[0]][entry.name] = {
+                        'entry_count': 0,
+                        'files': [],
+                        'total_size': 0,
+                        'file_types': Counter()
+                    }
+                elif depth == 2:
+                    walk['tree'][rel_parts[0]][rel_parts[1]]['entry_count'] += 1
+                continue
+            
+            series_data = walk['tree'][rel_parts[0]][rel_parts[1]] if depth == 2 else None
+            if series_data is not None:
+                series_data['entry_count'] += 1
+            
+            if entry.is_file():
+                size = entry.stat().st_size
+                if series_data is not None:
+                    series_data['files'].append((entry.name, entry.path, size))
+                    series_data['total_size'] += size
+                    series_data['file_types'][os.path.splitext(entry.name)[1].lower()] += 1
+                if entry.name.endswith('.txt'):
+                    walk['txt_files'].append((entry.path, size))
+        
+        return walk
+    
+    def _iter_tree(self, root: str = None) -> Iterator[Tuple[Tuple[str, ...], os.DirEntry]]:
+        """Yield (parent path parts relative to root, DirEntry) for everything under root.
+        
+        Depth-first, each directory's entries before its subdirectories'; skipped
+        directories are neither yielded nor entered. root defaults to base_dir.
+        An explicit stack avoids recursion limits on deep trees.
+        """
+        stack = [(root or str(self.base_dir), ())]
+        while stack:
+            path, rel_parts = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name in self._skip_dirs:
+                                continue
+                            subdirs.append((entry.path, rel_parts + (entry.name,)))
+                        yield rel_parts, entry
+            except OSError:
+                continue
+            
+            # Reversed so subdirectories are popped in scan order
+            stack.extend(reversed(subdirs))
+    
     def generate_content_inventory(self) -> Dict:
         """Generate comprehensive inventory of organized content."""
+        return self._build_inventory(self._walk_once())
+    
+    def _build_inventory(self, walk: Dict) -> Dict:
+        """Build the content inventory from a directory walk."""
         inventory = {
             'total_files': 0,
             'tractates': {},
@@ -212,28 +504,22 @@ class ContentOrganizer:
         
         print("Generating content inventory...")
         
-        total_size = 0
         file_sizes = []
         
-        for tractate_dir in self.base_dir.iterdir():
-            if not tractate_dir.is_dir() or tractate_dir.name in ['Logs', 'Reports']:
+        for tractate_name, series_dirs in walk['tree'].items():
+            if tractate_name in ['Logs', 'Reports']:
                 continue
             
-            tractate_name = tractate_dir.name
             inventory['tractates'][tractate_name] = {
                 'total_files': 0,
                 'series': {},
                 'total_size': 0
             }
             
-            for series_dir in tractate_dir.iterdir():
-                if not series_dir.is_dir():
-                    continue
-                
-                series_name = series_dir.name
-                series_files = list(series_dir.glob('*'))
-                series_count = len([f for f in series_files if f.is_file()])
-                series_size = sum(f.stat().st_size for f in series_files if f.is_file())
+            for series_name, series_data in series_dirs.items():
+                series_files = series_data['files']
+                series_count = len(series_files)
+                series_size = series_data['total_size']
                 
                 inventory['tractates'][tractate_name]['series'][series_name] = {
                     'file_count': series_count,
@@ -249,124 +535,143 @@ class ContentOrganizer:
                 inventory['series_breakdown'][series_name] += series_count
                 
                 # Track file types and sizes
-                for file_path in series_files:
-                    if file_path.is_file():
-                        ext = file_path.suffix.lower()
-                        inventory['file_types'][ext] = inventory['file_types'].get(ext, 0) + 1
-                        
-                        file_size = file_path.stat().st_size
-                        file_sizes.append(file_size)
-                        total_size += file_size
+                for ext, count in series_data['file_types'].items():
+                    inventory['file_types'][ext] = inventory['file_types'].get(ext, 0) + count
+                
+                file_sizes.extend(size for _, _, size in series_files)
             
             inventory['total_files'] += inventory['tractates'][tractate_name]['total_files']
         
-        # Calculate size statistics
+        # Calculate size statistics with vectorized reductions
         if file_sizes:
+            sizes = np.fromiter(file_sizes, dtype=np.int64, count=len(file_sizes))
+            total_size = int(sizes.sum())
             inventory['size_stats'] = {
                 'total_size_mb': total_size / (1024 * 1024),
-                'average_file_size_kb': (sum(file_sizes) / len(file_sizes)) / 1024,
-                'largest_file_mb': max(file_sizes) / (1024 * 1024),
-                'smallest_file_kb': min(file_sizes) / 1024
+                'average_file_size_kb': (total_size / sizes.size) / 1024,
+                'largest_file_mb': int(sizes.max()) / (1024 * 1024),
+                'smallest_file_kb': int(sizes.min()) / 1024
             }
         
         return inventory
     
-    def create_tractate_indexes(self):
+    def create_tractate_indexes(self, walk: Dict = None):
         """Create index files for each tractate."""
         print("Creating tractate indexes...")
         
-        for tractate_dir in self.base_dir.iterdir():
-            if not tractate_dir.is_dir() or tractate_dir.name in ['Logs', 'Reports', 'Unclassified']:
-                continue
-            
-            tractate_name = tractate_dir.name
-            index_file = tractate_dir / f"{tractate_name}_INDEX.md"
+        if walk is None:
+            walk = self._walk_once()
+        
+        tractates = [name for name in walk['tree'] if name not in ['Logs', 'Reports', 'Unclassified']]
+        
+        # Tractates are independent directories, so their indexes can be written concurrently
+        if tractates:
+            with ThreadPoolExecutor(max_workers=min(INDEX_WORKERS, len(tractates))) as executor:
+                list(executor.map(self._write_tractate_index, tractates,
+                                  [walk['tree'][name] for name in tractates]))
+        
+        print("Tractate indexes created")
+    
+    def _write_tractate_index(self, tractate_name: str, series_dirs: Dict):
+        """Write the index file for one tractate."""
+        index_file = self.base_dir / tractate_name / f"{tractate_name}_INDEX.md"
+        
+        parts = [
+            f"# {tractate_name} - Transcript Index\n\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        ]
+        
+        total_files = 0
+        
+        for series_name in sorted(series_dirs):
+            transcript_files = [(name, path, size) for name, path, size in series_dirs[series_name]['files']
+                                if os.path.splitext(name)[1] in ['.txt', '.json']]
             
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write(f"# {tractate_name} - Transcript Index\n\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                total_files = 0
+            if transcript_files:
+                parts.append(f"## {series_name} ({len(transcript_files)} files)\n\n")
                 
-                for series_dir in sorted(tractate_dir.iterdir()):
-                    if not series_dir.is_dir():
-                        continue
+                for name, path, size in sorted(transcript_files, key=lambda t: t[1]):
+                    # Extract basic info
+                    title = self.extract_title_from_file(Path(path))
+                    file_size = size / 1024  # KB
                     
-                    series_name = series_dir.name
-                    transcript_files = [f for f in series_dir.iterdir() if f.is_file() and f.suffix in ['.txt', '.json']]
-                    
-                    if transcript_files:
-                        f.write(f"## {series_name} ({len(transcript_files)} files)\n\n")
-                        
-                        for transcript_file in sorted(transcript_files):
-                            # Extract basic info
-                            title = self.extract_title_from_file(transcript_file)
-                            file_size = transcript_file.stat().st_size / 1024  # KB
-                            
-                            f.write(f"- **{title}**\n")
-                            f.write(f"  - File: `{transcript_file.name}`\n")
-                            f.write(f"  - Size: {file_size:.1f} KB\n")
-                            f.write(f"  - Path: `{series_name}/{transcript_file.name}`\n\n")
-                        
-                        total_files += len(transcript_files)
+                    parts.append(f"- **{title}**\n"
+                                 f"  - File: `{name}`\n"
+                                 f"  - Size: {file_size:.1f} KB\n"
+                                 f"  - Path: `{series_name}/{name}`\n\n")
                 
-                f.write(f"\n---\n**Total Files in {tractate_name}: {total_files}**\n")
+                total_files += len(transcript_files)
         
-        print("Tractate indexes created")
+        parts.append(f"\n---\n**Total Files in {tractate_name}: {total_files}**\n")
+        
+        with open(index_file, 'w', encoding='utf-8') as f:
+            f.writelines(parts)
     
-    def generate_master_index(self):
-        """Generate master index of all content."""
+    def generate_master_index(self, inventory: Dict = None):
+        """Generate master index of all content.
+        
+        Pass an inventory from generate_content_inventory() to avoid walking the tree again.
+        """
         master_index_file = self.base_dir / "MASTER_INDEX.md"
         
         print("Generating master index...")
         
-        with open(master_index_file, 'w', encoding='utf-8') as f:
-            f.write("# Mercaz Daf Yomi - Master Transcript Index\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
+        parts = [
+            "# Mercaz Daf Yomi - Master Transcript Index\n\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        ]
+        
+        if inventory is None:
             inventory = self.generate_content_inventory()
+        
+        parts.append("## Summary Statistics\n\n"
+                     f"- **Total Files**: {inventory['total_files']}\n"
+                     f"- **Total Size**: {inventory['size_stats'].get('total_size_mb', 0):.1f} MB\n"
+                     f"- **Average File Size**: {inventory['size_stats'].get('average_file_size_kb', 0):.1f} KB\n"
+                     f"- **Tractates Covered**: {len(inventory['tractates'])}\n\n")
+        
+        parts.append("## Tractate Breakdown\n\n")
+        for tractate, data in sorted(inventory['tractates'].items()):
+            parts.append(f"### {tractate} ({data['total_files']} files)\n\n")
             
-            f.write("## Summary Statistics\n\n")
-            f.write(f"- **Total Files**: {inventory['total_files']}\n")
-            f.write(f"- **Total Size**: {inventory['size_stats'].get('total_size_mb', 0):.1f} MB\n")
-            f.write(f"- **Average File Size**: {inventory['size_stats'].get('average_file_size_kb', 0):.1f} KB\n")
-            f.write(f"- **Tractates Covered**: {len(inventory['tractates'])}\n\n")
-            
-            f.write("## Tractate Breakdown\n\n")
-            for tractate, data in sorted(inventory['tractates'].items()):
-                f.write(f"### {tractate} ({data['total_files']} files)\n\n")
-                
-                for series, series_data in sorted(data['series'].items()):
-                    if series_data['file_count'] > 0:
-                        f.write(f"- **{series}**: {series_data['file_count']} files "
-                               f"({series_data['total_size']/1024:.1f} KB)\n")
-                f.write("\n")
-            
-            f.write("## Series Type Summary\n\n")
-            for series_type, count in sorted(inventory['series_breakdown'].items()):
-                f.write(f"- **{series_type}**: {count} files\n")
-            
-            f.write("\n## File Type Breakdown\n\n")
-            for file_type, count in sorted(inventory['file_types'].items()):
-                f.write(f"- **{file_type}**: {count} files\n")
-            
-            f.write("\n## Directory Structure\n\n")
-            f.write("```\n")
-            f.write("Mercaz_Daf_Yomi_Transcripts/\n")
-            for tractate in sorted(inventory['tractates'].keys()):
-                f.write(f"├── {tractate}/\n")
-                for series in sorted(inventory['tractates'][tractate]['series'].keys()):
-                    if inventory['tractates'][tractate]['series'][series]['file_count'] > 0:
-                        f.write(f"│   ├── {series}/\n")
-            f.write("├── Logs/\n")
-            f.write("├── Reports/\n")
-            f.write("└── MASTER_INDEX.md\n")
-            f.write("```\n")
+            for series, series_data in sorted(data['series'].items()):
+                if series_data['file_count'] > 0:
+                    parts.append(f"- **{series}**: {series_data['file_count']} files "
+                                 f"({series_data['total_size']/1024:.1f} KB)\n")
+            parts.append("\n")
+        
+        parts.append("## Series Type Summary\n\n")
+        for series_type, count in sorted(inventory['series_breakdown'].items()):
+            parts.append(f"- **{series_type}**: {count} files\n")
+        
+        parts.append("\n## File Type Breakdown\n\n")
+        for file_type, count in sorted(inventory['file_types'].items()):
+            parts.append(f"- **{file_type}**: {count} files\n")
+        
+        parts.append("\n## Directory Structure\n\n"
+                     "```\n"
+                     "Mercaz_Daf_Yomi_Transcripts/\n")
+        for tractate in sorted(inventory['tractates'].keys()):
+            parts.append(f"├── {tractate}/\n")
+            for series in sorted(inventory['tractates'][tractate]['series'].keys()):
+                if inventory['tractates'][tractate]['series'][series]['file_count'] > 0:
+                    parts.append(f"│   ├── {series}/\n")
+        parts.append("├── Logs/\n"
+                     "├── Reports/\n"
+                     "└── MASTER_INDEX.md\n"
+                     "```\n")
+        
+        with open(master_index_file, 'w', encoding='utf-8') as f:
+            f.writelines(parts)
         
         print(f"Master index created: {master_index_file}")
     
     def validate_organization(self) -> Dict:
         """Validate the organization and identify issues."""
+        return self._build_validation(self._walk_once())
+    
+    def _build_validation(self, walk: Dict) -> Dict:
+        """Build the validation report from a directory walk."""
         print("Validating content organization...")
         
         validation_report = {
@@ -380,59 +685,69 @@ class ContentOrganizer:
         }
         
         # Check for empty directories
-        for tractate_dir in self.base_dir.iterdir():
-            if tractate_dir.is_dir() and tractate_dir.name not in ['Logs', 'Reports']:
-                for series_dir in tractate_dir.iterdir():
-                    if series_dir.is_dir():
-                        files = list(series_dir.glob('*'))
-                        if not files:
-                            validation_report['empty_directories'].append(str(series_dir.relative_to(self.base_dir)))
-        
-        # Check file organization
-        file_hashes = {}
-        for file_path in self.base_dir.rglob('*.txt'):
-            validation_report['total_files_checked'] += 1
+        for tractate_name, series_dirs in walk['tree'].items():
+            if tractate_name not in ['Logs', 'Reports']:
+                for series_name, series_data in series_dirs.items():
+                    if not series_data['entry_count']:
+                        validation_report['empty_directories'].append(str(Path(tractate_name) / series_name))
+        
+        # Hash every file whose size collides with another, overlapping the reads across threads
+        size_counts = Counter(file_size for _, file_size in walk['txt_files'])
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as hash_executor:
+            digest_futures = {path: hash_executor.submit(_file_digest, path)
+                              for path, file_size in walk['txt_files'] if size_counts[file_size] > 1}
+            seen_digests = {}
             
-            try:
-                # Check if file is in correct location
-                title = self.extract_title_from_file(file_path)
-                expected_tractate, expected_series = self.classify_content(title)
+            # Classify every file's title in one batch
+            file_paths = [Path(path) for path, _ in walk['txt_files']]
+            expected = self._classify_files(file_paths)
+            
+            # Check file organization
+            for (path, file_size), file_path, (expected_tractate, expected_series) in zip(
+                    walk['txt_files'], file_paths, expected):
+                validation_report['total_files_checked'] += 1
                 
-                current_path_parts = file_path.parts
-                if len(current_path_parts) >= 3:
-                    current_tractate = current_path_parts[-3]
-                    current_series = current_path_parts[-2]
+                try:
+                    # Check if file is in correct location
+                    current_path_parts = file_path.parts
+                    if len(current_path_parts) >= 3:
+                        current_tractate = current_path_parts[-3]
+                        current_series = current_path_parts[-2]
+                        
+                        if current_tractate == expected_tractate and current_series == expected_series:
+                            validation_report['properly_organized'] += 1
+                        else:
+                            validation_report['misplaced_files'].append({
+                                'file': str(file_path.relative_to(self.base_dir)),
+                                'current_location': f"{current_tractate}/{current_series}",
+                                'suggested_location': f"{expected_tractate}/{expected_series}"
+                            })
                     
-                    if current_tractate == expected_tractate and current_series == expected_series:
-                        validation_report['properly_organized'] += 1
-                    else:
-                        validation_report['misplaced_files'].append({
-                            'file': str(file_path.relative_to(self.base_dir)),
-                            'current_location': f"{current_tractate}/{current_series}",
-                            'suggested_location': f"{expected_tractate}/{expected_series}"
-                        })
-                
-                # Check for duplicates (simple hash check)
-                file_size = file_path.stat().st_size
-                file_key = f"{file_path.name}_{file_size}"
-                if file_key in file_hashes:
-                    validation_report['duplicate_files'].append({
-                        'file1': str(file_hashes[file_key].relative_to(self.base_dir)),
-                        'file2': str(file_path.relative_to(self.base_dir))
+                    # Check for duplicates by content; only files sharing a size can match
+                    if path in digest_futures:
+                        digest = digest_futures[path].result()
+                        if digest in seen_digests:
+                            validation_report['duplicate_files'].append({
+                                'file1': str(seen_digests[digest].relative_to(self.base_dir)),
+                                'file2': str(file_path.relative_to(self.base_dir))
+                            })
+                        else:
+                            seen_digests[digest] = file_path
+                    
+                except Exception as e:
+                    validation_report['corrupted_files'].append({
+                        'file': str(file_path.relative_to(self.base_dir)),
+                        'error': str(e)
                     })
-                else:
-                    file_hashes[file_key] = file_path
-                
-            except Exception as e:
-                validation_report['corrupted_files'].append({
-                    'file': str(file_path.relative_to(self.base_dir)),
-                    'error': str(e)
-                })
-        
+            
         return validation_report
     
-    def save_reports(self, output_dir: str = None):
-        """Save all organization reports."""
+    def save_reports(self, output_dir: str = None, walk: Dict = None, inventory: Dict = None):
+        """Save all organization reports.
+        
+        A walk from _walk_once() and an inventory built from it may be passed in
+        to reuse work already done this run.
+        """
         if output_dir:
             reports_dir = Path(output_dir)
         else:
@@ -441,43 +756,49 @@ class ContentOrganizer:
         reports_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
+        # Inventory and validation share a single walk of the tree
+        if walk is None:
+            walk = self._walk_once()
+        
         # Save inventory
-        inventory = self.generate_content_inventory()
-        with open(reports_dir / f"content_inventory_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(inventory, f, indent=2, ensure_ascii=False)
+        if inventory is None:
+            inventory = self._build_inventory(walk)
+        _write_json(reports_dir / f"content_inventory_{timestamp}.json", inventory)
         
         # Save validation report
-        validation = self.validate_organization()
-        with open(reports_dir / f"validation_report_{timestamp}.json", 'w', encoding='utf-8') as f:
-            json.dump(validation, f, indent=2, ensure_ascii=False)
+        validation = self._build_validation(walk)
+        _write_json(reports_dir / f"validation_report_{timestamp}.json", validation)
         
         # Save summary report
-        with open(reports_dir / f"organization_summary_{timestamp}.txt", 'w', encoding='utf-8') as f:
-            f.write("CONTENT ORGANIZATION SUMMARY\n")
-            f.write("=" * 40 + "\n\n")
-            f.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Base Directory: {self.base_dir}\n\n")
+        summary = [
+            "CONTENT ORGANIZATION SUMMARY\n",
+            "=" * 40 + "\n\n",
+            f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Base Directory: {self.base_dir}\n\n",
             
-            f.write("INVENTORY SUMMARY:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Total Files: {inventory['total_files']}\n")
-            f.write(f"Total Size: {inventory['size_stats'].get('total_size_mb', 0):.1f} MB\n")
-            f.write(f"Tractates: {len(inventory['tractates'])}\n\n")
+            "INVENTORY SUMMARY:\n",
+            "-" * 20 + "\n",
+            f"Total Files: {inventory['total_files']}\n",
+            f"Total Size: {inventory['size_stats'].get('total_size_mb', 0):.1f} MB\n",
+            f"Tractates: {len(inventory['tractates'])}\n\n",
             
-            f.write("VALIDATION SUMMARY:\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Files Checked: {validation['total_files_checked']}\n")
-            f.write(f"Properly Organized: {validation['properly_organized']}\n")
-            f.write(f"Misplaced Files: {len(validation['misplaced_files'])}\n")
-            f.write(f"Empty Directories: {len(validation['empty_directories'])}\n")
-            f.write(f"Duplicate Files: {len(validation['duplicate_files'])}\n")
-            f.write(f"Corrupted Files: {len(validation['corrupted_files'])}\n")
+            "VALIDATION SUMMARY:\n",
+            "-" * 20 + "\n",
+            f"Files Checked: {validation['total_files_checked']}\n",
+            f"Properly Organized: {validation['properly_organized']}\n",
+            f"Misplaced Files: {len(validation['misplaced_files'])}\n",
+            f"Empty Directories: {len(validation['empty_directories'])}\n",
+            f"Duplicate Files: {len(validation['duplicate_files'])}\n",
+            f"Corrupted Files: {len(validation['corrupted_files'])}\n"
+        ]
+        with open(reports_dir / f"organization_summary_{timestamp}.txt", 'w', encoding='utf-8') as f:
+            f.writelines(summary)
         
         print(f"Reports saved to: {reports_dir}")
 
 
-def main():
-    """Main entry point."""
+def main(argv=None):
+    """Main entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(description="Organize Mercaz Daf Yomi transcript content")
     parser.add_argument('--base-dir', default='Mercaz_Daf_Yomi_Transcripts', 
                        help='Base directory for transcripts')
@@ -493,7 +814,7 @@ def main():
     parser.add_argument('--all', action='store_true', 
                        help='Run all organization tasks')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         organizer = ContentOrganizer(args.base_dir)
@@ -504,12 +825,21 @@ def main():
         if args.all or args.organize_files:
             organizer.organize_existing_files(args.source_dir)
         
+        # Walk the organized tree once and share it between indexes and reports
+        walk = None
+        inventory = None
+        if args.all or args.create_indexes or args.generate_reports:
+            walk = organizer._walk_once()
+            inventory = organizer._build_inventory(walk)
+        
         if args.all or args.create_indexes:
-            organizer.create_tractate_indexes()
-            organizer.generate_master_index()
+            organizer.create_tractate_indexes(walk)
+            organizer.generate_master_index(inventory)
         
         if args.all or args.generate_reports:
-            organizer.save_reports()
+            organizer.save_reports(walk=walk, inventory=inventory)
+        
+        organizer.save_cache()
         
         print("Content organization completed successfully!")
         
@@ -517,6 +847,7 @@ def main():
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -5,27 +5,99 @@ Supports bulk processing of 5,000+ videos with comprehensive features.
 """
 
 import os
+import sys
 import csv
 import json
 import time
 import logging
 import argparse
+import queue
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Third-party imports
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    YouTubeTranscriptApi, AgeRestricted, InvalidVideoId, NoTranscriptFound,
+    RequestBlocked, TranscriptsDisabled, VideoUnavailable, VideoUnplayable
+)
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+# Video ID extraction, tried in order against a URL
+_VIDEO_URL_PATTERNS = (
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)'),
+    re.compile(r'youtube\.com\/v\/([^&\n?#]+)'),
+    re.compile(r'youtube\.com\/watch\?.*v=([^&\n?#]+)')
+)
+
+# ISO 8601 durations as returned by the Data API (e.g. PT1H2M3S)
+_ISO8601_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+# Series keywords in priority order, with the series each one selects
+SERIES_KEYWORDS = (('daf yomi', 'Daf_Yomi'), ('shiur', 'Shiurim'), ('lecture', 'Lectures'))
+
+# Keywords marking special events, used when no tractate matches
+EVENT_KEYWORDS = ('special', 'event', 'announcement')
+
+# Threads writing transcript files in the background
+SAVE_WORKERS = 4
+
+# videos.list accepts at most this many comma-separated IDs per request
+VIDEOS_LIST_MAX_IDS = 50
+
+# Transcript error codes that may succeed on a later attempt; anything else is
+# permanent (e.g. NO_TRANSCRIPT, VIDEO_UNAVAILABLE) and is not retried
+RETRYABLE_ERROR_CODES = frozenset({'RATE_LIMITED', 'NETWORK', 'UNKNOWN'})
+
+# Columns of master_catalog.csv and failed_videos.csv
+CATALOG_FIELDS = [
+    'video_id', 'title', 'url', 'published_at', 'duration', 'view_count',
+    'transcript_file', 'transcript_type', 'language', 'word_count',
+    'duration_covered', 'tractate', 'series_type', 'status', 'processed_at'
+]
+FAILED_FIELDS = ['video_id', 'title', 'error', 'timestamp']
+
+# Partial response for playlistItems.list: just the fields the channel listing uses
+PLAYLIST_ITEMS_FIELDS = ('items(contentDetails/videoId,snippet(title,publishedAt,thumbnails/medium/url)),'
+                         'nextPageToken')
+
+# Keep-alive connection pool shared by all transcript fetches
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Transcript requests that may go out back to back after the workers have been idle
+RATE_LIMIT_BURST = 1
+
+# Playlist pages the channel listing thread may run ahead of extraction
+VIDEO_QUEUE_PAGES = 8
+
+# Put on the video queue by the listing thread once the channel is exhausted
+_END_OF_VIDEOS = object()
+
+
+class ChannelListingError(Exception):
+    """Raised to the extraction loop when the channel listing thread fails part way."""
+
+
 class MercazDafYomiExtractor:
     """Enhanced YouTube transcript extractor for Mercaz Daf Yomi channel."""
     
@@ -34,9 +106,36 @@ class MercazDafYomiExtractor:
         self.config = self.load_config(config_file)
         self.setup_logging()
         self.youtube_service = None
-        self.progress_file = "extraction_progress.json"
-        self.master_catalog = []
-        self.failed_videos = []
+        self.progress_file = "extraction_progress.jsonl"
+        self.legacy_progress_file = "extraction_progress.json"
+        self._unsaved_progress = []  # Records not yet appended to progress_file
+        self.failed_videos = []  # Failures not yet written to failed_videos.csv
+        # Summary counters, updated as each video finishes
+        self._stats = {
+            'total_videos': 0,
+            'successful': 0,
+            'failed': 0,
+            'tractate_counts': Counter(),
+            'language_counts': Counter(),
+            'total_words': 0
+        }
+        self._catalog_file = None
+        self._failed_file = None
+        self._build_classifier()
+        
+        # Transcript files are written here so disk writes overlap network fetches
+        self._save_pool = ThreadPoolExecutor(max_workers=SAVE_WORKERS)
+        
+        # One session for the whole run so transcript fetches reuse TLS connections
+        self._http_session = requests.Session()
+        self._http_session.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                                                         pool_maxsize=HTTP_POOL_MAXSIZE))
+        self._transcript_api = YouTubeTranscriptApi(http_client=self._http_session)
+        
+        # rate_limit_seconds spaces transcript requests across all workers, not per worker
+        rate_limit_seconds = self.config['rate_limit_seconds']
+        self._rate_limiter = (TokenBucket(1 / rate_limit_seconds, RATE_LIMIT_BURST)
+                              if rate_limit_seconds > 0 else None)
         
         # Initialize YouTube Data API if key provided
         if self.config.get('youtube_api_key'):
@@ -56,6 +155,7 @@ class MercazDafYomiExtractor:
             "output_directory": "Mercaz_Daf_Yomi_Transcripts",
             "batch_size": 50,
             "rate_limit_seconds": 2,
+            "max_concurrent_requests": 8,
             "max_retries": 3,
             "resume_on_restart": True,
             "organize_by_tractate": True,
@@ -155,14 +255,8 @@ class MercazDafYomiExtractor:
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract video ID from various YouTube URL formats."""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-            r'youtube\.com\/v\/([^&\n?#]+)',
-            r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _VIDEO_URL_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         
@@ -170,90 +264,154 @@ class MercazDafYomiExtractor:
     
     def get_channel_videos(self, channel_handle: str = None, max_results: int = None) -> List[Dict]:
         """Get all videos from the Mercaz Daf Yomi channel using YouTube Data API."""
+        try:
+            return [video_data
+                    for page in self.iter_channel_video_pages(channel_handle, max_results)
+                    for video_data in page]
+            
+        except HttpError as e:
+            self.logger.error(f"YouTube API error: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error fetching channel videos: {e}")
+            return []
+    
+    def iter_channel_video_pages(self, channel_handle: str = None,
+                                 max_results: int = None) -> Iterator[List[Dict]]:
+        """Yield the channel's videos one playlist page at a time; API errors propagate."""
         if not self.youtube_service:
             self.logger.error("YouTube Data API not initialized. Cannot fetch channel videos.")
-            return []
+            return
         
         channel_handle = channel_handle or self.config['channel_handle']
-        videos = []
         
-        try:
-            # First, get channel ID from handle
-            if not self.config.get('channel_id'):
-                channel_response = self.youtube_service.channels().list(
-                    part='id,snippet',
-                    forHandle=channel_handle.replace('@', '')
-                ).execute()
-                
-                if not channel_response['items']:
-                    self.logger.error(f"Channel not found: {channel_handle}")
-                    return []
-                
-                channel_id = channel_response['items'][0]['id']
-                self.config['channel_id'] = channel_id
-                self.logger.info(f"Found channel ID: {channel_id}")
-            else:
-                channel_id = self.config['channel_id']
-            
-            # Get all playlists from the channel
-            playlists_response = self.youtube_service.playlists().list(
-                part='id,snippet',
-                channelId=channel_id,
-                maxResults=50
+        # Resolve the channel and its uploads playlist (main channel videos) in one call
+        if not self.config.get('channel_id'):
+            channel_response = self.youtube_service.channels().list(
+                part='id,contentDetails',
+                forHandle=channel_handle.replace('@', '')
             ).execute()
             
-            # Get videos from uploads playlist (main channel videos)
+            if not channel_response.get('items'):
+                self.logger.error(f"Channel not found: {channel_handle}")
+                return
+            
+            channel_id = channel_response['items'][0]['id']
+            self.config['channel_id'] = channel_id
+            self.logger.info(f"Found channel ID: {channel_id}")
+        else:
             channel_response = self.youtube_service.channels().list(
                 part='contentDetails',
-                id=channel_id
+                id=self.config['channel_id']
+            ).execute()
+        
+        uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        
+        # Fetch all videos from uploads playlist
+        next_page_token = None
+        video_count = 0
+        
+        while True:
+            # Only fetch what the listing needs; descriptions arrive later with
+            # the batched videos.list metadata in process_video_batch
+            playlist_response = self.youtube_service.playlistItems().list(
+                part='snippet,contentDetails',
+                playlistId=uploads_playlist_id,
+                maxResults=50,
+                pageToken=next_page_token,
+                fields=PLAYLIST_ITEMS_FIELDS
             ).execute()
             
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # Fetch all videos from uploads playlist
-            next_page_token = None
-            video_count = 0
-            
-            while True:
-                playlist_response = self.youtube_service.playlistItems().list(
-                    part='snippet,contentDetails',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-                
-                for item in playlist_response['items']:
-                    if max_results and video_count >= max_results:
-                        break
-                    
-                    video_data = {
-                        'video_id': item['contentDetails']['videoId'],
-                        'title': item['snippet']['title'],
-                        'description': item['snippet']['description'],
-                        'published_at': item['snippet']['publishedAt'],
-                        'thumbnail_url': item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                        'url': f"https://www.youtube.com/watch?v={item['contentDetails']['videoId']}"
-                    }
-                    
-                    videos.append(video_data)
-                    video_count += 1
-                
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token or (max_results and video_count >= max_results):
+            page = []
+            for item in playlist_response['items']:
+                if max_results and video_count >= max_results:
                     break
                 
-                # Rate limiting
-                time.sleep(0.1)
+                video_data = {
+                    'video_id': item['contentDetails']['videoId'],
+                    'title': item['snippet']['title'],
+                    'published_at': item['snippet']['publishedAt'],
+                    'thumbnail_url': item['snippet'].get('thumbnails', {}).get('medium', {}).get('url', ''),
+                    'url': f"https://www.youtube.com/watch?v={item['contentDetails']['videoId']}"
+                }
+                
+                page.append(video_data)
+                video_count += 1
             
-            self.logger.info(f"Found {len(videos)} videos from channel {channel_handle}")
-            return videos
+            if page:
+                yield page
             
+            next_page_token = playlist_response.get('nextPageToken')
+            if not next_page_token or (max_results and video_count >= max_results):
+                break
+        
+        self.logger.info(f"Found {video_count} videos from channel {channel_handle}")
+    
+    def _list_channel_videos(self, video_queue: queue.Queue, max_results: int = None):
+        """Listing thread: put the channel's video pages on video_queue, then _END_OF_VIDEOS.
+        
+        If listing fails, a ChannelListingError goes on the queue instead of _END_OF_VIDEOS.
+        """
+        try:
+            for page in self.iter_channel_video_pages(max_results=max_results):
+                video_queue.put(page)
         except HttpError as e:
             self.logger.error(f"YouTube API error: {e}")
-            return []
+            video_queue.put(ChannelListingError(f"YouTube API error: {e}"))
         except Exception as e:
             self.logger.error(f"Error fetching channel videos: {e}")
-            return []
+            video_queue.put(ChannelListingError(f"Error fetching channel videos: {e}"))
+        else:
+            video_queue.put(_END_OF_VIDEOS)
+    
+    def _iter_batches(self, video_queue: queue.Queue, skip_ids, counts: Dict) -> Iterator[List[Dict]]:
+        """Group queued videos into batches of batch_size, leaving out skip_ids.
+        
+        counts['listed'] and counts['skipped'] are updated as videos arrive. Raises
+        ChannelListingError if the listing thread failed.
+        """
+        batch_size = self.config['batch_size']
+        batch = []
+        while True:
+            page = video_queue.get()
+            if page is _END_OF_VIDEOS:
+                break
+            if isinstance(page, ChannelListingError):
+                raise page
+            
+            counts['listed'] += len(page)
+            for video_data in page:
+                if video_data['video_id'] in skip_ids:
+                    counts['skipped'] += 1
+                    continue
+                batch.append(video_data)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        
+        if batch:
+            yield batch
+    
+    def _build_classifier(self):
+        """Precompile the tractate and series keywords into one regex with a group per label."""
+        groups = []
+        self._group_labels = {}
+        tractates = list(self.config['tractate_patterns'].items())
+        for i, (tractate, patterns) in enumerate(tractates):
+            if patterns:
+                group = f"t{i}"
+                groups.append(f"(?P<{group}>{'|'.join(re.escape(p) for p in patterns)})")
+                self._group_labels[group] = ('tractate', i, tractate)
+        for i, (keyword, series_type) in enumerate(SERIES_KEYWORDS):
+            group = f"s{i}"
+            groups.append(f"(?P<{group}>{re.escape(keyword)})")
+            self._group_labels[group] = ('series', i, series_type)
+        groups.append(f"(?P<event>{'|'.join(re.escape(word) for word in EVENT_KEYWORDS)})")
+        self._group_labels['event'] = ('event', 0, None)
+        
+        # The zero-width lookahead reports a hit at every position, so
+        # overlapping mentions are seen just as plain substring tests would
+        self._classify_regex = re.compile(f"(?=(?:{'|'.join(groups)}))")
     
     def classify_video(self, title: str, description: str = "") -> Tuple[str, str]:
         """Classify video by tractate and series type."""
@@ -261,77 +419,86 @@ class MercazDafYomiExtractor:
         description_lower = description.lower()
         combined_text = f"{title_lower} {description_lower}"
         
-        # Check for tractate patterns
-        for tractate, patterns in self.config['tractate_patterns'].items():
-            for pattern in patterns:
-                if pattern in combined_text:
-                    # Determine series type
-                    if 'daf yomi' in combined_text:
-                        series_type = 'Daf_Yomi'
-                    elif 'shiur' in combined_text:
-                        series_type = 'Shiurim'
-                    elif 'lecture' in combined_text:
-                        series_type = 'Lectures'
-                    else:
-                        series_type = 'General'
-                    
-                    return tractate, series_type
+        # One scan over the text; the first-listed tractate and series keyword win,
+        # as checking them in order would
+        tractate = None
+        series = None
+        is_event = False
+        for match in self._classify_regex.finditer(combined_text):
+            kind, rank, label = self._group_labels[match.lastgroup]
+            if kind == 'tractate':
+                if tractate is None or rank < tractate[0]:
+                    tractate = (rank, label)
+            elif kind == 'series':
+                if series is None or rank < series[0]:
+                    series = (rank, label)
+            else:
+                is_event = True
+        
+        if tractate is not None:
+            return tractate[1], series[1] if series is not None else 'General'
         
         # Default classification
-        if 'daf yomi' in combined_text:
+        if series is not None and series[1] == 'Daf_Yomi':
             return 'Unclassified', 'Daf_Yomi'
-        elif any(word in combined_text for word in ['special', 'event', 'announcement']):
+        elif is_event:
             return 'Special_Series', 'Events'
         else:
             return 'Unclassified', 'General'
     
     def get_video_metadata(self, video_id: str) -> Optional[Dict]:
         """Get detailed video metadata using YouTube Data API."""
+        return self.get_video_metadata_bulk([video_id]).get(video_id)
+    
+    def get_video_metadata_bulk(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Get detailed metadata for many videos, 50 IDs per videos.list call.
+        
+        Returns {video_id: metadata}; videos that could not be fetched are omitted.
+        """
         if not self.youtube_service:
-            return None
+            return {}
         
-        try:
-            response = self.youtube_service.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=video_id
-            ).execute()
-            
-            if not response['items']:
-                return None
-            
-            item = response['items'][0]
-            
-            # Parse duration
-            duration_str = item['contentDetails']['duration']
-            duration_seconds = self.parse_duration(duration_str)
-            
-            metadata = {
-                'video_id': video_id,
-                'title': item['snippet']['title'],
-                'description': item['snippet']['description'],
-                'published_at': item['snippet']['publishedAt'],
-                'duration': duration_str,
-                'duration_seconds': duration_seconds,
-                'view_count': int(item['statistics'].get('viewCount', 0)),
-                'like_count': int(item['statistics'].get('likeCount', 0)),
-                'comment_count': int(item['statistics'].get('commentCount', 0)),
-                'thumbnail_url': item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                'channel_title': item['snippet']['channelTitle'],
-                'tags': item['snippet'].get('tags', [])
-            }
-            
-            return metadata
-            
-        except Exception as e:
-            self.logger.warning(f"Could not fetch metadata for {video_id}: {e}")
-            return None
+        metadata_by_id = {}
+        for start in range(0, len(video_ids), VIDEOS_LIST_MAX_IDS):
+            chunk = video_ids[start:start + VIDEOS_LIST_MAX_IDS]
+            try:
+                response = self.youtube_service.videos().list(
+                    part='snippet,contentDetails,statistics',
+                    id=','.join(chunk)
+                ).execute()
+                
+                for item in response['items']:
+                    metadata_by_id[item['id']] = self._parse_video_metadata(item)
+                    
+            except Exception as e:
+                self.logger.warning(f"Could not fetch metadata for {', '.join(chunk)}: {e}")
+        
+        return metadata_by_id
+    
+    def _parse_video_metadata(self, item: Dict) -> Dict:
+        """Build a metadata record from one videos.list item."""
+        # Parse duration
+        duration_str = item['contentDetails']['duration']
+        duration_seconds = self.parse_duration(duration_str)
+        
+        return {
+            'video_id': item['id'],
+            'title': item['snippet']['title'],
+            'description': item['snippet']['description'],
+            'published_at': item['snippet']['publishedAt'],
+            'duration': duration_str,
+            'duration_seconds': duration_seconds,
+            'view_count': int(item['statistics'].get('viewCount', 0)),
+            'like_count': int(item['statistics'].get('likeCount', 0)),
+            'comment_count': int(item['statistics'].get('commentCount', 0)),
+            'thumbnail_url': item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
+            'channel_title': item['snippet']['channelTitle'],
+            'tags': item['snippet'].get('tags', [])
+        }
     
     def parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration to seconds."""
-        import re
-        
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
+        match = _ISO8601_DURATION_RE.match(duration_str)
         
         if not match:
             return 0
@@ -349,13 +516,13 @@ class MercazDafYomiExtractor:
             'transcript_type': None,
             'language': None,
             'error': None,
+            'error_code': None,
             'word_count': 0,
             'duration_covered': 0
         }
         
         try:
-            # Create API instance
-            api = YouTubeTranscriptApi()
+            api = self._transcript_api
             
             # Priority order: Hebrew first (this is a Hebrew channel), then English
             language_priorities = ['iw', 'he', 'en', 'en-US', 'en-GB']
@@ -379,51 +546,66 @@ class MercazDafYomiExtractor:
                     result['language'] = 'auto-detected'
                 except Exception as e:
                     result['error'] = f"No transcripts available: {str(e)}"
+                    result['error_code'] = self._transcript_error_code(e)
                     return None, None, result
             
             if not fetched_transcript:
                 result['error'] = "Empty transcript data"
+                result['error_code'] = 'NO_TRANSCRIPT'
                 return None, None, result
             
-            # Convert FetchedTranscript to list of dicts and plain text
+            # Convert FetchedTranscript to list of dicts, plain text and word count in one pass.
+            # Snippets are joined with spaces, so per-snippet split() counts add up to
+            # the count for the whole text.
             transcript_data = []
-            full_text = ""
-            
+            text_parts = []
+            word_count = 0
             for snippet in fetched_transcript:
-                entry = {
-                    'text': snippet.text,
+                text = snippet.text
+                transcript_data.append({
+                    'text': text,
                     'start': snippet.start,
                     'duration': snippet.duration
-                }
-                transcript_data.append(entry)
-                full_text += snippet.text + " "
-            
-            full_text = full_text.strip()
+                })
+                text_parts.append(text)
+                word_count += len(text.split())
+            full_text = " ".join(text_parts).strip()
             
             # Determine transcript type (assume auto-generated for now)
             result['transcript_type'] = 'auto-generated'
             
             # Update result metadata
             result['success'] = True
-            result['word_count'] = len(full_text.split())
-            result['duration_covered'] = transcript_data[-1]['start'] + transcript_data[-1]['duration'] if transcript_data else 0
+            result['word_count'] = word_count
+            if transcript_data:
+                last = transcript_data[-1]
+                result['duration_covered'] = last['start'] + last['duration']
             
             return full_text, transcript_data, result
             
         except Exception as e:
             result['error'] = str(e)
+            result['error_code'] = self._transcript_error_code(e)
             self.logger.warning(f"Error extracting transcript for {video_id}: {e}")
             return None, None, result
     
+    @staticmethod
+    def _transcript_error_code(error: Exception) -> str:
+        """Map a transcript fetch exception to an error code (see RETRYABLE_ERROR_CODES)."""
+        if isinstance(error, (NoTranscriptFound, TranscriptsDisabled)):
+            return 'NO_TRANSCRIPT'
+        if isinstance(error, (VideoUnavailable, VideoUnplayable, AgeRestricted, InvalidVideoId)):
+            return 'VIDEO_UNAVAILABLE'
+        if isinstance(error, RequestBlocked):
+            return 'RATE_LIMITED'
+        if isinstance(error, requests.RequestException):
+            return 'NETWORK'
+        return 'UNKNOWN'
+    
     def save_transcript(self, video_data: Dict, transcript_text: str, 
-                       transcript_data: List, metadata: Dict) -> str:
-        """Save transcript to organized file structure."""
-        # Classify video
-        tractate, series_type = self.classify_video(
-            video_data['title'], 
-            video_data.get('description', '')
-        )
-        
+                       transcript_data: List, metadata: Dict,
+                       tractate: str, series_type: str) -> str:
+        """Save transcript to organized file structure under its tractate and series."""
         # Create directory structure
         base_dir = Path(self.config['output_directory'])
         if self.config['organize_by_tractate']:
@@ -441,66 +623,139 @@ class MercazDafYomiExtractor:
         
         # Write transcript file
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"Title: {video_data['title']}\n")
-            f.write(f"Video ID: {video_data['video_id']}\n")
-            f.write(f"URL: {video_data['url']}\n")
-            f.write(f"Published: {video_data.get('published_at', 'Unknown')}\n")
-            f.write(f"Tractate: {tractate}\n")
-            f.write(f"Series: {series_type}\n")
-            f.write(f"Transcript Type: {metadata.get('transcript_type', 'Unknown')}\n")
-            f.write(f"Language: {metadata.get('language', 'Unknown')}\n")
-            f.write(f"Word Count: {metadata.get('word_count', 0)}\n")
-            f.write(f"Duration Covered: {metadata.get('duration_covered', 0):.1f} seconds\n")
-            f.write("-" * 80 + "\n\n")
-            f.write(transcript_text)
-            
-            # Add structured data section
-            f.write("\n\n" + "=" * 80 + "\n")
-            f.write("STRUCTURED TRANSCRIPT DATA (JSON)\n")
-            f.write("=" * 80 + "\n")
-            f.write(json.dumps(transcript_data, indent=2, ensure_ascii=False))
+            f.writelines([
+                f"Title: {video_data['title']}\n",
+                f"Video ID: {video_data['video_id']}\n",
+                f"URL: {video_data['url']}\n",
+                f"Published: {video_data.get('published_at', 'Unknown')}\n",
+                f"Tractate: {tractate}\n",
+                f"Series: {series_type}\n",
+                f"Transcript Type: {metadata.get('transcript_type', 'Unknown')}\n",
+                f"Language: {metadata.get('language', 'Unknown')}\n",
+                f"Word Count: {metadata.get('word_count', 0)}\n",
+                f"Duration Covered: {metadata.get('duration_covered', 0):.1f} seconds\n",
+                "-" * 80 + "\n\n",
+                transcript_text,
+                
+                # Add structured data section
+                "\n\n" + "=" * 80 + "\n",
+                "STRUCTURED TRANSCRIPT DATA (JSON)\n",
+                "=" * 80 + "\n"
+            ])
+            
+            if orjson is not None:
+                # Write through the text layer so newlines are translated like the header
+                f.write(orjson.dumps(transcript_data,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8'))
+            else:
+                # Stream the JSON straight into the file rather than building it as one string
+                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
         
         return str(filepath)
     
     def load_progress(self) -> Dict:
-        """Load extraction progress from file."""
+        """Load extraction progress by replaying the append-only progress log."""
+        progress = {
+            'completed_videos': set(),
+            'failed_videos': set(),
+            'last_batch': 0,
+            'total_processed': 0,
+            'start_time': None
+        }
+        
         if not os.path.exists(self.progress_file):
-            return {
-                'completed_videos': [],
-                'failed_videos': [],
-                'last_batch': 0,
-                'total_processed': 0,
-                'start_time': None
-            }
+            return self._load_legacy_progress(progress)
         
         try:
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(self.progress_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = loads(line)
+                    if 'video_id' in record:
+                        if record['status'] == 'ok':
+                            progress['completed_videos'].add(record['video_id'])
+                            progress['total_processed'] += 1
+                        else:
+                            progress['failed_videos'].add(record['video_id'])
+                    if 'last_batch' in record:
+                        progress['last_batch'] = record['last_batch']
+                    if progress['start_time'] is None and record.get('start_time'):
+                        progress['start_time'] = record['start_time']
         except Exception as e:
             self.logger.warning(f"Could not load progress file: {e}")
-            return {
-                'completed_videos': [],
-                'failed_videos': [],
-                'last_batch': 0,
-                'total_processed': 0,
-                'start_time': None
-            }
+        
+        return progress
+    
+    def _load_legacy_progress(self, progress: Dict) -> Dict:
+        """Read progress saved by older versions as one JSON document."""
+        if not os.path.exists(self.legacy_progress_file):
+            return progress
+        
+        try:
+            with open(self.legacy_progress_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            
+            progress.update(legacy)
+            progress['completed_videos'] = set(legacy.get('completed_videos', []))
+            progress['failed_videos'] = set(legacy.get('failed_videos', []))
+            
+            # Carry it into the log so later appends build on it
+            self._unsaved_progress.extend(
+                {'video_id': video_id, 'status': 'ok'} for video_id in sorted(progress['completed_videos']))
+            self._unsaved_progress.extend(
+                {'video_id': video_id, 'status': 'fail'} for video_id in sorted(progress['failed_videos']))
+        except Exception as e:
+            self.logger.warning(f"Could not load progress file: {e}")
+        
+        return progress
+    
+    def _log_progress(self, video_id: str, status: str):
+        """Queue a completion ('ok') or failure ('fail') record for the next save_progress."""
+        self._unsaved_progress.append({
+            'video_id': video_id,
+            'status': status,
+            'ts': datetime.now().isoformat()
+        })
     
     def save_progress(self, progress: Dict):
-        """Save extraction progress to file."""
+        """Append this batch's progress records to the progress log."""
+        records = self._unsaved_progress + [{
+            'last_batch': progress['last_batch'],
+            'start_time': progress.get('start_time')
+        }]
+        
         try:
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                data = b''.join(orjson.dumps(record) + b'\n' for record in records)
+            else:
+                data = ''.join(json.dumps(record, ensure_ascii=False) + '\n'
+                               for record in records).encode('utf-8')
+            with open(self.progress_file, 'ab') as f:
+                f.write(data)
+                f.flush()
+            self._unsaved_progress = []
         except Exception as e:
             self.logger.error(f"Could not save progress: {e}")
     
     def process_video_batch(self, videos: List[Dict], batch_num: int, 
-                           total_batches: int, progress: Dict) -> List[Dict]:
-        """Process a batch of videos with comprehensive error handling."""
+                           total_batches: Optional[int], progress: Dict) -> List[Dict]:
+        """Process a batch of videos with comprehensive error handling.
+        
+        total_batches is only used for logging and may be None when the total isn't known yet.
+        """
         batch_results = []
         
-        self.logger.info(f"Processing batch {batch_num}/{total_batches} ({len(videos)} videos)")
+        batch_label = f"{batch_num}/{total_batches}" if total_batches else f"{batch_num}"
+        self.logger.info(f"Processing batch {batch_label} ({len(videos)} videos)")
+        
+        # Get additional metadata if available, in as few API calls as possible
+        unprocessed_ids = [video_data['video_id'] for video_data in videos
+                           if video_data['video_id'] not in progress['completed_videos']]
+        detailed_metadata = self.get_video_metadata_bulk(unprocessed_ids)
         
+        pending = []
         for i, video_data in enumerate(videos):
             video_id = video_data['video_id']
             
@@ -511,86 +766,29 @@ class MercazDafYomiExtractor:
             
             self.logger.info(f"Processing video {i+1}/{len(videos)}: {video_data['title']}")
             
-            # Get additional metadata if available
-            if self.youtube_service:
-                detailed_metadata = self.get_video_metadata(video_id)
-                if detailed_metadata:
-                    video_data.update(detailed_metadata)
-            
-            # Extract transcript with retries
-            transcript_text = None
-            transcript_data = None
-            extraction_metadata = None
+            if video_id in detailed_metadata:
+                video_data.update(detailed_metadata[video_id])
             
-            for attempt in range(self.config['max_retries']):
-                try:
-                    transcript_text, transcript_data, extraction_metadata = self.extract_transcript(video_id)
-                    if extraction_metadata['success']:
-                        break
-                    else:
-                        self.logger.warning(f"Attempt {attempt + 1} failed for {video_id}: {extraction_metadata['error']}")
-                except Exception as e:
-                    self.logger.warning(f"Attempt {attempt + 1} failed for {video_id}: {e}")
-                
-                if attempt < self.config['max_retries'] - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-            
-            # Process result
-            if transcript_text and extraction_metadata['success']:
-                try:
-                    # Save transcript
-                    filepath = self.save_transcript(video_data, transcript_text, 
-                                                  transcript_data, extraction_metadata)
-                    
-                    # Create result record
-                    result = {
-                        'video_id': video_id,
-                        'title': video_data['title'],
-                        'url': video_data['url'],
-                        'published_at': video_data.get('published_at'),
-                        'duration': video_data.get('duration'),
-                        'view_count': video_data.get('view_count', 0),
-                        'transcript_file': filepath,
-                        'transcript_type': extraction_metadata['transcript_type'],
-                        'language': extraction_metadata['language'],
-                        'word_count': extraction_metadata['word_count'],
-                        'duration_covered': extraction_metadata['duration_covered'],
-                        'tractate': self.classify_video(video_data['title'], 
-                                                      video_data.get('description', ''))[0],
-                        'series_type': self.classify_video(video_data['title'], 
-                                                         video_data.get('description', ''))[1],
-                        'status': 'success',
-                        'processed_at': datetime.now().isoformat()
-                    }
-                    
-                    batch_results.append(result)
-                    progress['completed_videos'].append(video_id)
-                    progress['total_processed'] += 1
-                    
-                    self.logger.info(f"Successfully processed: {video_data['title']}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error saving transcript for {video_id}: {e}")
-                    self.failed_videos.append({
-                        'video_id': video_id,
-                        'title': video_data['title'],
-                        'error': f"Save error: {str(e)}",
-                        'timestamp': datetime.now().isoformat()
-                    })
-            else:
-                # Record failure
-                error_msg = extraction_metadata['error'] if extraction_metadata else "Unknown error"
-                self.failed_videos.append({
-                    'video_id': video_id,
-                    'title': video_data['title'],
-                    'error': error_msg,
-                    'timestamp': datetime.now().isoformat()
-                })
-                progress['failed_videos'].append(video_id)
-                self.logger.warning(f"Failed to process: {video_data['title']} - {error_msg}")
+            pending.append(video_data)
+        
+        # Transcript fetches are network-bound, so overlap them across a bounded
+        # pool of workers; results are still handled in batch order below
+        workers = max(1, min(self.config['max_concurrent_requests'], len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            extractions = executor.map(self._extract_with_retries,
+                                       [video_data['video_id'] for video_data in pending])
             
-            # Rate limiting
-            time.sleep(self.config['rate_limit_seconds'])
+            saves = []
+            for video_data, (transcript_text, transcript_data, extraction_metadata) in zip(pending, extractions):
+                save = self._record_extraction(video_data, transcript_text, transcript_data,
+                                               extraction_metadata, progress)
+                if save is not None:
+                    saves.append(save)
+        
+        # Wait for this batch's writes before reporting it complete
+        for video_data, extraction_metadata, classification, future in saves:
+            self._finish_save(video_data, extraction_metadata, classification, future,
+                              progress, batch_results)
         
         # Save progress after each batch
         progress['last_batch'] = batch_num
@@ -598,49 +796,171 @@ class MercazDafYomiExtractor:
         
         return batch_results
     
-    def generate_master_catalog(self, all_results: List[Dict]):
-        """Generate comprehensive master catalog CSV."""
-        catalog_file = Path(self.config['output_directory']) / "master_catalog.csv"
+    def _extract_with_retries(self, video_id: str) -> Tuple[Optional[str], Optional[List], Optional[Dict]]:
+        """Extract one transcript with retries and backoff, waiting on the shared rate limit before each attempt."""
+        transcript_text = None
+        transcript_data = None
+        extraction_metadata = None
         
-        fieldnames = [
-            'video_id', 'title', 'url', 'published_at', 'duration', 'view_count',
-            'transcript_file', 'transcript_type', 'language', 'word_count',
-            'duration_covered', 'tractate', 'series_type', 'status', 'processed_at'
-        ]
+        for attempt in range(self.config['max_retries']):
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                transcript_text, transcript_data, extraction_metadata = self.extract_transcript(video_id)
+                if extraction_metadata['success']:
+                    break
+                else:
+                    self.logger.warning(f"Attempt {attempt + 1} failed for {video_id}: {extraction_metadata['error']}")
+                    if extraction_metadata['error_code'] not in RETRYABLE_ERROR_CODES:
+                        break
+            except Exception as e:
+                self.logger.warning(f"Attempt {attempt + 1} failed for {video_id}: {e}")
+            
+            if attempt < self.config['max_retries'] - 1:
+                time.sleep(2 ** attempt)  # Exponential backoff
+        
+        return transcript_text, transcript_data, extraction_metadata
+    
+    def _record_extraction(self, video_data: Dict, transcript_text: Optional[str],
+                           transcript_data: Optional[List], extraction_metadata: Optional[Dict],
+                           progress: Dict) -> Optional[Tuple[Dict, Dict, Tuple[str, str], Future]]:
+        """Queue a successful transcript for saving, or record the failed extraction.
+        
+        Returns (video_data, extraction_metadata, (tractate, series_type), save future)
+        to pass to _finish_save, or None if the extraction failed.
+        """
+        video_id = video_data['video_id']
+        
+        # Process result
+        if transcript_text and extraction_metadata['success']:
+            # Classify once; the file header and the result record share it
+            tractate, series_type = self.classify_video(
+                video_data['title'], 
+                video_data.get('description', '')
+            )
+            future = self._save_pool.submit(self.save_transcript, video_data, transcript_text,
+                                            transcript_data, extraction_metadata,
+                                            tractate, series_type)
+            return video_data, extraction_metadata, (tractate, series_type), future
+        
+        # Record failure
+        error_msg = extraction_metadata['error'] if extraction_metadata else "Unknown error"
+        self._record_failure(video_data, error_msg)
+        progress['failed_videos'].add(video_id)
+        self._log_progress(video_id, 'fail')
+        self.logger.warning(f"Failed to process: {video_data['title']} - {error_msg}")
+        return None
+    
+    def _finish_save(self, video_data: Dict, extraction_metadata: Dict,
+                     classification: Tuple[str, str], future: Future,
+                     progress: Dict, batch_results: List[Dict]):
+        """Wait for a queued transcript save and record the result."""
+        video_id = video_data['video_id']
+        
+        try:
+            # Save transcript
+            filepath = future.result()
+            tractate, series_type = classification
+            
+            # Create result record
+            result = {
+                'video_id': video_id,
+                'title': video_data['title'],
+                'url': video_data['url'],
+                'published_at': video_data.get('published_at'),
+                'duration': video_data.get('duration'),
+                'view_count': video_data.get('view_count', 0),
+                'transcript_file': filepath,
+                'transcript_type': extraction_metadata['transcript_type'],
+                'language': extraction_metadata['language'],
+                'word_count': extraction_metadata['word_count'],
+                'duration_covered': extraction_metadata['duration_covered'],
+                'tractate': tractate,
+                'series_type': series_type,
+                'status': 'success',
+                'processed_at': datetime.now().isoformat()
+            }
+            
+            batch_results.append(result)
+            
+            stats = self._stats
+            stats['total_videos'] += 1
+            stats['successful'] += 1
+            stats['tractate_counts'][tractate] += 1
+            stats['language_counts'][result['language']] += 1
+            stats['total_words'] += result['word_count']
+            
+            progress['completed_videos'].add(video_id)
+            self._log_progress(video_id, 'ok')
+            progress['total_processed'] += 1
+            
+            self.logger.info(f"Successfully processed: {video_data['title']}")
+            
+        except Exception as e:
+            self.logger.error(f"Error saving transcript for {video_id}: {e}")
+            self._record_failure(video_data, f"Save error: {str(e)}")
+    
+    def _record_failure(self, video_data: Dict, error: str):
+        """Buffer a failed video for failed_videos.csv and count it for the summary."""
+        self.failed_videos.append({
+            'video_id': video_data['video_id'],
+            'title': video_data['title'],
+            'error': error,
+            'timestamp': datetime.now().isoformat()
+        })
+        self._stats['failed'] += 1
+    
+    def open_reports(self, append: bool = False):
+        """Open master_catalog.csv and failed_videos.csv for rows to be streamed in per batch.
         
-        with open(catalog_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_results)
+        When resuming from earlier progress records, the catalog is appended to, since
+        completed videos are not revisited. Failed videos are retried on every run, so their file starts fresh.
+        """
+        base_dir = Path(self.config['output_directory'])
         
-        self.logger.info(f"Master catalog saved to: {catalog_file}")
+        self._catalog_file = open(base_dir / "master_catalog.csv", 'a' if append else 'w',
+                                  newline='', encoding='utf-8')
+        self._catalog_writer = csv.DictWriter(self._catalog_file, fieldnames=CATALOG_FIELDS)
+        if self._catalog_file.tell() == 0:
+            self._catalog_writer.writeheader()
         
-        # Generate summary statistics
-        self.generate_summary_report(all_results)
+        self._failed_file = open(base_dir / "failed_videos.csv", 'w', newline='', encoding='utf-8')
+        self._failed_writer = csv.DictWriter(self._failed_file, fieldnames=FAILED_FIELDS)
+        self._failed_writer.writeheader()
     
-    def generate_summary_report(self, all_results: List[Dict]):
-        """Generate comprehensive summary report."""
-        report_file = Path(self.config['output_directory']) / "extraction_summary.txt"
+    def write_batch_reports(self, batch_results: List[Dict]):
+        """Append a batch's results and failures to the open reports.
         
-        # Calculate statistics
-        total_videos = len(all_results)
-        successful = len([r for r in all_results if r['status'] == 'success'])
-        failed = len(self.failed_videos)
+        The rows are flushed and dropped from memory; the summary only needs self._stats.
+        """
+        self._catalog_writer.writerows(batch_results)
+        self._failed_writer.writerows(self.failed_videos)
+        self._catalog_file.flush()
+        self._failed_file.flush()
         
-        # Tractate breakdown
-        tractate_counts = {}
-        for result in all_results:
-            tractate = result.get('tractate', 'Unknown')
-            tractate_counts[tractate] = tractate_counts.get(tractate, 0) + 1
+        self.failed_videos = []
+    
+    def close_reports(self):
+        """Close the streamed report files."""
+        for report in (self._catalog_file, self._failed_file):
+            if report is not None:
+                report.close()
         
-        # Language breakdown
-        language_counts = {}
-        for result in all_results:
-            lang = result.get('language', 'Unknown')
-            language_counts[lang] = language_counts.get(lang, 0) + 1
+        if self._catalog_file is not None:
+            self.logger.info(f"Master catalog saved to: {self._catalog_file.name}")
+        self._catalog_file = None
+        self._failed_file = None
+    
+    def generate_summary_report(self):
+        """Generate comprehensive summary report from the running counters."""
+        base_dir = Path(self.config['output_directory'])
+        report_file = base_dir / "extraction_summary.txt"
+        stats = self._stats
         
-        # Total word count
-        total_words = sum(r.get('word_count', 0) for r in all_results)
+        total_videos = stats['total_videos']
+        successful = stats['successful']
+        failed = stats['failed']
+        total_words = stats['total_words']
         
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write("MERCAZ DAF YOMI TRANSCRIPT EXTRACTION SUMMARY\n")
@@ -653,12 +973,12 @@ class MercazDafYomiExtractor:
             
             f.write("TRACTATE BREAKDOWN:\n")
             f.write("-" * 30 + "\n")
-            for tractate, count in sorted(tractate_counts.items()):
+            for tractate, count in sorted(stats['tractate_counts'].items()):
                 f.write(f"{tractate}: {count} videos\n")
             
             f.write(f"\nLANGUAGE BREAKDOWN:\n")
             f.write("-" * 30 + "\n")
-            for lang, count in sorted(language_counts.items()):
+            for lang, count in sorted(stats['language_counts'].items()):
                 f.write(f"{lang}: {count} videos\n")
             
             f.write(f"\nCONTENT STATISTICS:\n")
@@ -666,22 +986,28 @@ class MercazDafYomiExtractor:
             f.write(f"Total words extracted: {total_words:,}\n")
             f.write(f"Average words per video: {total_words//total_videos if total_videos > 0 else 0:,}\n")
             
-            if self.failed_videos:
+            if failed:
                 f.write(f"\nFAILED VIDEOS:\n")
                 f.write("-" * 30 + "\n")
-                for failed in self.failed_videos:
-                    f.write(f"- {failed['title']} ({failed['video_id']}): {failed['error']}\n")
+                with open(base_dir / "failed_videos.csv", 'r', newline='', encoding='utf-8') as failed_file:
+                    for failed_video in csv.DictReader(failed_file):
+                        f.write(f"- {failed_video['title']} ({failed_video['video_id']}): {failed_video['error']}\n")
         
         self.logger.info(f"Summary report saved to: {report_file}")
     
     def run_extraction(self, max_videos: int = None, resume: bool = True):
-        """Run the complete extraction process."""
+        """Run the complete extraction process.
+        
+        Returns False if the channel listing failed; progress files are then kept for a resumed run.
+        """
         self.logger.info("Starting enhanced YouTube transcript extraction")
         
-        # Load progress if resuming
+        # Load progress if resuming; a fresh run starts a new progress log
+        if not resume and os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
         progress = self.load_progress() if resume else {
-            'completed_videos': [],
-            'failed_videos': [],
+            'completed_videos': set(),
+            'failed_videos': set(),
             'last_batch': 0,
             'total_processed': 0,
             'start_time': datetime.now().isoformat()
@@ -690,65 +1016,80 @@ class MercazDafYomiExtractor:
         if not progress.get('start_time'):
             progress['start_time'] = datetime.now().isoformat()
         
-        # Get all videos from channel
+        # List the channel on a separate thread so extraction starts with the first
+        # playlist pages instead of waiting for the whole channel to be listed
         self.logger.info("Fetching videos from Mercaz Daf Yomi channel...")
-        all_videos = self.get_channel_videos(max_results=max_videos)
-        
-        if not all_videos:
-            self.logger.error("No videos found. Check channel configuration.")
-            return
+        video_queue = queue.Queue(maxsize=VIDEO_QUEUE_PAGES)
+        threading.Thread(target=self._list_channel_videos, args=(video_queue, max_videos),
+                         daemon=True).start()
         
         # Filter out already processed videos if resuming
-        if resume and progress['completed_videos']:
-            remaining_videos = [v for v in all_videos 
-                              if v['video_id'] not in progress['completed_videos']]
-            self.logger.info(f"Resuming extraction. {len(remaining_videos)} videos remaining.")
-        else:
-            remaining_videos = all_videos
+        skip_ids = progress['completed_videos'] if resume else ()
+        counts = {'listed': 0, 'skipped': 0}
+        batches = self._iter_batches(video_queue, skip_ids, counts)
         
-        if not remaining_videos:
-            self.logger.info("All videos already processed!")
-            return
+        try:
+            batch_videos = next(batches, None)
+        except ChannelListingError:
+            self.logger.error("Channel listing failed. No videos extracted.")
+            return False
+        if batch_videos is None:
+            if not counts['listed']:
+                self.logger.error("No videos found. Check channel configuration.")
+            else:
+                self.logger.info("All videos already processed!")
+            return True
         
-        # Process in batches
-        batch_size = self.config['batch_size']
-        total_batches = (len(remaining_videos) + batch_size - 1) // batch_size
-        all_results = []
+        if skip_ids:
+            self.logger.info(f"Resuming extraction. Skipping {len(skip_ids)} videos already processed.")
         
-        for i in range(0, len(remaining_videos), batch_size):
-            batch_num = (i // batch_size) + 1
-            
-            # Skip batches if resuming
-            if resume and batch_num <= progress.get('last_batch', 0):
-                continue
-            
-            batch_videos = remaining_videos[i:i + batch_size]
-            batch_results = self.process_video_batch(
-                batch_videos, batch_num, total_batches, progress
-            )
-            all_results.extend(batch_results)
-            
-            self.logger.info(f"Completed batch {batch_num}/{total_batches}")
-            
-            # Optional pause between batches
-            if batch_num < total_batches:
-                time.sleep(5)
+        # Process in batches, streaming each batch's rows to the catalog as it finishes.
+        # The catalog is only continued when earlier progress records were found; a
+        # finished run archives its progress log, so the next run rewrites every row
+        self.open_reports(append=bool(progress['completed_videos'] or progress['failed_videos']))
+        try:
+            batch_num = 1
+            while batch_videos is not None:
+                # Skip batches if resuming
+                processed = not (resume and batch_num <= progress.get('last_batch', 0))
+                if processed:
+                    batch_results = self.process_video_batch(
+                        batch_videos, batch_num, None, progress
+                    )
+                    self.write_batch_reports(batch_results)
+                    
+                    self.logger.info(f"Completed batch {batch_num}")
+                
+                batch_videos = next(batches, None)
+                batch_num += 1
+                
+                # Optional pause between batches
+                if processed and batch_videos is not None:
+                    time.sleep(5)
+        except ChannelListingError:
+            self.logger.error(f"Channel listing failed after {counts['listed']} videos. "
+                              "Progress kept; rerun to resume.")
+            return False
+        finally:
+            self.close_reports()
         
         # Generate final reports
         self.logger.info("Generating final reports...")
-        self.generate_master_catalog(all_results)
+        self.generate_summary_report()
         
-        # Clean up progress file
-        if os.path.exists(self.progress_file):
-            os.rename(self.progress_file, 
-                     f"{self.progress_file}.completed_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        # Clean up progress files
+        for progress_file in (self.progress_file, self.legacy_progress_file):
+            if os.path.exists(progress_file):
+                os.rename(progress_file, 
+                         f"{progress_file}.completed_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         
         self.logger.info("Extraction completed successfully!")
         self.logger.info(f"Results saved to: {self.config['output_directory']}")
+        return True
 
 
-def main():
-    """Main entry point with command line interface."""
+def main(argv=None):
+    """Main entry point with command line interface; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description="Enhanced YouTube Transcript Extractor for Mercaz Daf Yomi"
     )
@@ -783,7 +1124,7 @@ def main():
         help='Override batch size from config'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         # Initialize extractor
@@ -810,17 +1151,20 @@ def main():
             return
         
         # Run full extraction
-        extractor.run_extraction(
+        if not extractor.run_extraction(
             max_videos=args.max_videos,
             resume=not args.no_resume
-        )
+        ):
+            sys.exit(1)
         
     except KeyboardInterrupt:
         print("\nExtraction interrupted by user")
+        sys.exit(130)  # 128 + SIGINT, as the shell reports a Ctrl-C
     except Exception as e:
         print(f"Error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -6,18 +6,191 @@ Includes GitHub integration and project lifecycle management
 """
 
 import os
+import errno
 import json
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Source directories never copied into a new project
+SKIP_COPY_DIRS = ('.git', '__pycache__', 'node_modules')
+
+# Copies are I/O bound, so allow well over one thread per core
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Threads reading .project-metadata.json files for listings and reports
+METADATA_WORKERS = 16
+
+# Threads creating the status/category directory tree
+MKDIR_WORKERS = 8
+
+# Write buffer for the portfolio report, so fragments reach disk in large writes
+REPORT_BUFFER_SIZE = 1 << 20
+
+# Skeletons for the files generated in every new project
+README_TEMPLATE = """# {name}
+
+## Overview
+{description}
+
+## Technologies
+{technologies}
+
+## Setup Instructions
+
+1. Clone the repository
+2. Copy `.env.example` to `.env` and configure
+3. Install dependencies
+4. Run the application
+
+## Project Structure
+
+```
+{name}/
+├── README.md                 # This file
+├── .env.example             # Environment variables template
+├── .project-metadata.json   # Project metadata
+├── .project-status.md       # Current status and next steps
+├── docs/                    # Documentation
+├── src/                     # Source code
+├── tests/                   # Test files
+├── assets/                  # Images, fonts, etc.
+├── scripts/                 # Build/deployment scripts
+└── config/                  # Configuration files
+```
+
+## Status
+- **Category**: {category}
+- **Status**: {status}
+- **Created**: {created}
+- **GitHub**: {github_repo}
+
+## Next Steps
+See `.project-status.md` for current status and next steps.
+
+---
+Created: {today}
+"""
+
+PROJECT_STATUS_TEMPLATE = """# Project Status: {name}
+
+## Current Status: {status}
+
+**Last Updated**: {updated_at}
+
+## Next Steps
+- [ ] Define project requirements
+- [ ] Set up development environment
+- [ ] Create initial implementation
+- [ ] Add tests
+- [ ] Create documentation
+- [ ] Set up GitHub repository
+- [ ] Deploy/publish
+
+## Recent Updates
+- {today}: Project created
+
+## Notes
+{notes}
+
+## GitHub Repository
+{github_repo}
+
+---
+**Project Path**: `{project_path}`  
+**Category**: {category}  
+**Technologies**: {technologies}
+"""
+
+
+def _read_json(path: Path):
+    """Read a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_bytes(data) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json(path: Path, data):
+    """Write data as indented UTF-8 JSON"""
+    path.write_bytes(_json_bytes(data))
+
+
+@lru_cache(maxsize=None)
+def _git_user_name() -> str:
+    """user.name from git config, read once per process"""
+    try:
+        result = subprocess.run(["git", "config", "user.name"], 
+                              capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except:
+        return "your-username"
+
+
+def _fast_copy(src, dst):
+    """Copy file data and permission bits, skipping the timestamp/xattr work of copy2"""
+    with open(src, 'rb') as fsrc:
+        st = os.fstat(fsrc.fileno())
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+        with open(fd, 'wb') as fdst:
+            if sys.platform.startswith('linux'):
+                # Copy inside the kernel, straight from the page cache
+                try:
+                    offset = 0
+                    while offset < st.st_size:
+                        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, st.st_size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    return dst
+                except OSError:
+                    # Filesystems without sendfile support; copy in userspace instead
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    return dst
+
+
+@dataclass
+class ProjectInfo:
+    """Project metadata template, saved as .project-metadata.json"""
+    name: str = ""
+    category: str = ""
+    status: str = "active"
+    description: str = ""
+    created_date: str = ""
+    last_updated: str = ""
+    github_repo: str = ""
+    technologies: List[str] = field(default_factory=list)
+    next_steps: List[str] = field(default_factory=list)
+    notes: str = ""
+
+
 class ProjectManager:
-    def __init__(self, base_path: str = None):
+    def __init__(self, base_path: str = None, verbose: bool = False):
         """Initialize the Project Manager with base desktop path"""
+        # Print every directory created and file copied, not just summaries
+        self.verbose = verbose
+        
         if base_path:
             self.desktop_path = Path(base_path)
         else:
@@ -45,37 +218,29 @@ class ProjectManager:
             "Publishing"
         ]
         
-        # Project templates
-        self.project_template = {
-            "name": "",
-            "category": "",
-            "status": "active",
-            "description": "",
-            "created_date": "",
-            "last_updated": "",
-            "github_repo": "",
-            "technologies": [],
-            "next_steps": [],
-            "notes": ""
-        }
+        # {name: (path, status, category)} for every project, built on first lookup
+        self._project_index: Optional[Dict[str, Tuple[Path, str, str]]] = None
+        self._project_layout: Dict[str, Dict[str, List[Path]]] = {}
 
     def ensure_directory_structure(self):
         """Ensure all required directories exist"""
         print("🏗️  Ensuring directory structure...")
         
-        # Create main status directories
-        for status, path in self.status_dirs.items():
-            path.mkdir(exist_ok=True)
-            print(f"✅ {status}: {path}")
+        # Collect every directory with its progress line, then create them all at once
+        status_dirs = self.status_dirs
+        categories = self.categories
+        all_dirs = []
+        
+        # Main status directories
+        for status, path in status_dirs.items():
+            all_dirs.append((path, f"✅ {status}: {path}"))
             
-            # Create category subdirectories (except resources)
+            # Category subdirectories (except resources)
             if status != "resources":
-                for category in self.categories:
-                    category_path = path / category
-                    category_path.mkdir(exist_ok=True)
-                    print(f"   📁 {category}")
+                for category in categories:
+                    all_dirs.append((path / category, f"   📁 {category}"))
         
-        # Create resources subdirectories
+        # Resources subdirectories
         resources_subdirs = [
             "Templates",
             "Documentation", 
@@ -84,10 +249,17 @@ class ProjectManager:
             "Configurations"
         ]
         
+        resources_path = status_dirs["resources"]
         for subdir in resources_subdirs:
-            subdir_path = self.status_dirs["resources"] / subdir
-            subdir_path.mkdir(exist_ok=True)
-            print(f"📚 Resources/{subdir}")
+            all_dirs.append((resources_path / subdir, f"📚 Resources/{subdir}"))
+        
+        with ThreadPoolExecutor(max_workers=MKDIR_WORKERS) as executor:
+            list(executor.map(lambda target: target[0].mkdir(parents=True, exist_ok=True), all_dirs))
+        
+        if self.verbose:
+            for _, message in all_dirs:
+                print(message)
+        print(f"✅ Ensured {len(all_dirs)} directories under {self.desktop_path}")
 
     def create_project(self, name: str, category: str, status: str = "active", 
                       description: str = "", technologies: List[str] = None,
@@ -112,6 +284,7 @@ class ProjectManager:
             return project_path
         
         project_path.mkdir(parents=True, exist_ok=True)
+        self._project_index = None
         print(f"📁 Created project directory: {project_path}")
         
         # Copy source files if provided
@@ -119,42 +292,70 @@ class ProjectManager:
             source = Path(source_path)
             print(f"📋 Copying files from: {source}")
             
-            for item in source.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, project_path)
-                    print(f"   📄 {item.name}")
-                elif item.is_dir() and item.name not in ['.git', '__pycache__', 'node_modules']:
-                    shutil.copytree(item, project_path / item.name, dirs_exist_ok=True)
-                    print(f"   📁 {item.name}/")
+            entries = [item for item in source.iterdir()
+                       if item.is_file() or (item.is_dir() and item.name not in SKIP_COPY_DIRS)]
+            
+            # Copy top-level entries in parallel; results come back in order and
+            # the first failed copy is re-raised here
+            file_count = 0
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                copied = executor.map(lambda item: self._copy_entry(item, project_path), entries)
+                for item, is_file in zip(entries, copied):
+                    file_count += is_file
+                    if not self.verbose:
+                        continue
+                    if is_file:
+                        print(f"   📄 {item.name}")
+                    else:
+                        print(f"   📁 {item.name}/")
+            print(f"   Copied {file_count} files and {len(entries) - file_count} directories")
         
         # Create standard project structure
         self._create_project_structure(project_path)
         
+        # One timestamp for every file written below
+        now = datetime.now()
+        timestamp = now.isoformat()
+        today = now.strftime('%Y-%m-%d')
+        
         # Create project metadata
-        project_info = self.project_template.copy()
-        project_info.update({
-            "name": name,
-            "category": category,
-            "status": status,
-            "description": description,
-            "created_date": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "github_repo": github_repo,
-            "technologies": technologies
-        })
-        
-        # Save project metadata
-        self._save_project_metadata(project_path, project_info)
-        
-        # Create README if it doesn't exist
-        self._create_readme(project_path, project_info)
-        
-        # Create project status file
-        self._create_project_status(project_path, project_info)
+        project_info = asdict(ProjectInfo(
+            name=name,
+            category=category,
+            status=status,
+            description=description,
+            created_date=timestamp,
+            last_updated=timestamp,
+            github_repo=github_repo,
+            technologies=technologies
+        ))
+        
+        # Project metadata, status file and README (unless the source provided one),
+        # written together in the background
+        artifacts = [
+            (project_path / ".project-metadata.json", _json_bytes(project_info)),
+            (project_path / ".project-status.md",
+             self._render_project_status(project_path, project_info,
+                                         now.strftime('%Y-%m-%d %H:%M'), today).encode('utf-8'))
+        ]
+        readme_path = project_path / "README.md"
+        if not readme_path.exists():
+            artifacts.append((readme_path, self._render_readme(project_info, today).encode('utf-8')))
+        
+        with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+            list(executor.map(lambda artifact: artifact[0].write_bytes(artifact[1]), artifacts))
         
         print(f"✅ Project '{name}' created successfully!")
         return project_path
 
+    def _copy_entry(self, item: Path, dest: Path) -> bool:
+        """Copy one file or directory into dest; returns True if it was a file"""
+        if item.is_file():
+            _fast_copy(item, dest / item.name)
+            return True
+        shutil.copytree(item, dest / item.name, copy_function=_fast_copy, dirs_exist_ok=True)
+        return False
+
     def _create_project_structure(self, project_path: Path):
         """Create standard project directory structure"""
         standard_dirs = [
@@ -170,102 +371,43 @@ class ProjectManager:
             dir_path = project_path / dir_name
             dir_path.mkdir(exist_ok=True)
         
-        # Create .env.example if it doesn't exist
-        env_example = project_path / ".env.example"
-        if not env_example.exists():
-            env_example.write_text("# Environment variables template\n# Copy to .env and fill in values\n")
-
-    def _save_project_metadata(self, project_path: Path, project_info: Dict):
-        """Save project metadata to .project-metadata.json"""
-        metadata_file = project_path / ".project-metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(project_info, f, indent=2, ensure_ascii=False)
-
-    def _create_readme(self, project_path: Path, project_info: Dict):
-        """Create README.md if it doesn't exist"""
-        readme_path = project_path / "README.md"
-        if readme_path.exists():
-            return
-            
-        readme_content = f"""# {project_info['name']}
-
-## Overview
-{project_info['description'] or 'Project description goes here.'}
-
-## Technologies
-{chr(10).join(f'- {tech}' for tech in project_info['technologies']) if project_info['technologies'] else '- List technologies used'}
-
-## Setup Instructions
-
-1. Clone the repository
-2. Copy `.env.example` to `.env` and configure
-3. Install dependencies
-4. Run the application
-
-## Project Structure
-
-```
-{project_info['name']}/
-├── README.md                 # This file
-├── .env.example             # Environment variables template
-├── .project-metadata.json   # Project metadata
-├── .project-status.md       # Current status and next steps
-├── docs/                    # Documentation
-├── src/                     # Source code
-├── tests/                   # Test files
-├── assets/                  # Images, fonts, etc.
-├── scripts/                 # Build/deployment scripts
-└── config/                  # Configuration files
-```
-
-## Status
-- **Category**: {project_info['category']}
-- **Status**: {project_info['status']}
-- **Created**: {project_info['created_date'][:10]}
-- **GitHub**: {project_info['github_repo'] or 'Not yet created'}
-
-## Next Steps
-See `.project-status.md` for current status and next steps.
-
----
-Created: {datetime.now().strftime('%Y-%m-%d')}
-"""
-        readme_path.write_text(readme_content, encoding='utf-8')
-
-    def _create_project_status(self, project_path: Path, project_info: Dict):
-        """Create .project-status.md file"""
-        status_path = project_path / ".project-status.md"
-        
-        status_content = f"""# Project Status: {project_info['name']}
-
-## Current Status: {project_info['status'].title()}
-
-**Last Updated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-
-## Next Steps
-- [ ] Define project requirements
-- [ ] Set up development environment
-- [ ] Create initial implementation
-- [ ] Add tests
-- [ ] Create documentation
-- [ ] Set up GitHub repository
-- [ ] Deploy/publish
-
-## Recent Updates
-- {datetime.now().strftime('%Y-%m-%d')}: Project created
-
-## Notes
-{project_info['notes'] or 'Add project notes here...'}
-
-## GitHub Repository
-{project_info['github_repo'] or 'Not yet created - use `python project_manager.py github-setup` to create'}
+        # Create .env.example unless the copied source already has one
+        try:
+            with open(project_path / ".env.example", 'xb') as f:
+                f.write(b"# Environment variables template\n# Copy to .env and fill in values\n")
+        except FileExistsError:
+            pass
+
+    def _render_readme(self, project_info: Dict, today: str) -> str:
+        """Build the README.md content for a new project"""
+        technologies = project_info['technologies']
+        return README_TEMPLATE.format(
+            name=project_info['name'],
+            description=project_info['description'] or 'Project description goes here.',
+            technologies='\n'.join(f'- {tech}' for tech in technologies) if technologies else '- List technologies used',
+            category=project_info['category'],
+            status=project_info['status'],
+            created=project_info['created_date'][:10],
+            github_repo=project_info['github_repo'] or 'Not yet created',
+            today=today
+        )
 
----
-**Project Path**: `{project_path}`  
-**Category**: {project_info['category']}  
-**Technologies**: {', '.join(project_info['technologies']) if project_info['technologies'] else 'Not specified'}
-"""
-        status_path.write_text(status_content, encoding='utf-8')
+    def _render_project_status(self, project_path: Path, project_info: Dict,
+                               updated_at: str, today: str) -> str:
+        """Build the .project-status.md content for a new project"""
+        technologies = project_info['technologies']
+        return PROJECT_STATUS_TEMPLATE.format(
+            name=project_info['name'],
+            status=project_info['status'].title(),
+            updated_at=updated_at,
+            today=today,
+            notes=project_info['notes'] or 'Add project notes here...',
+            github_repo=project_info['github_repo']
+                        or 'Not yet created - use `python project_manager.py github-setup` to create',
+            project_path=project_path,
+            category=project_info['category'],
+            technologies=', '.join(technologies) if technologies else 'Not specified'
+        )
 
     def move_project(self, project_name: str, new_status: str, new_category: str = None):
         """Move project to different status/category"""
@@ -287,7 +429,14 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
         
         # Move project
         new_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(current_path), str(new_path))
+        try:
+            os.replace(current_path, new_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different filesystem: copy the tree across and remove the original
+            shutil.move(str(current_path), str(new_path))
+        self._project_index = None
         
         # Update metadata
         self._update_project_metadata(new_path, {"status": new_status, "category": new_category})
@@ -297,26 +446,66 @@ Created: {datetime.now().strftime('%Y-%m-%d')}
 
     def _find_project(self, project_name: str) -> Optional[Path]:
         """Find project by name across all status directories"""
-        for status_path in self.status_dirs.values():
-            if not status_path.exists():
+        if self._project_index is None:
+            # Without an index, probe the standard locations directly and stop at the first hit
+            categories = self.categories
+            for status_path in self.status_dirs.values():
+                for category in categories:
+                    candidate = status_path / category / project_name
+                    if os.path.isdir(candidate):
+                        return candidate
+            
+            # Not in a standard category (e.g. moved to a custom one); scan everything
+            self._scan_projects()
+        location = self._project_index.get(project_name)
+        return location[0] if location else None
+
+    def _projects_by_location(self) -> Dict[str, Dict[str, List[Path]]]:
+        """Return {status: {category: [project paths]}} for the existing directories"""
+        if self._project_index is None:
+            self._scan_projects()
+        return self._project_layout
+
+    def _scan_projects(self):
+        """Scan the status/category tree once and index every project directory.
+        
+        When a name appears more than once, the index keeps the first match in
+        status directory order, as the old per-lookup search did. Directory types
+        come from the listing itself, so symlinked directories are not followed.
+        """
+        layout = {}
+        index = {}
+        for status_name, status_path in self.status_dirs.items():
+            try:
+                with os.scandir(status_path) as it:
+                    category_entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+            except FileNotFoundError:
                 continue
-            for category_path in status_path.iterdir():
-                if category_path.is_dir():
-                    project_path = category_path / project_name
-                    if project_path.exists():
-                        return project_path
-        return None
+            
+            categories = layout[status_name] = {}
+            for category_entry in category_entries:
+                projects = categories[category_entry.name] = []
+                with os.scandir(category_entry.path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            project_path = Path(entry.path)
+                            projects.append(project_path)
+                            index.setdefault(entry.name, (project_path, status_name, category_entry.name))
+        
+        self._project_layout = layout
+        self._project_index = index
 
     def _update_project_metadata(self, project_path: Path, updates: Dict):
         """Update project metadata"""
         metadata_file = project_path / ".project-metadata.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            metadata.update(updates)
-            metadata["last_updated"] = datetime.now().isoformat()
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            metadata = _read_json(metadata_file)
+            updated = {**metadata, **updates}
+            if updated == metadata:
+                # Nothing but the timestamp would change; leave the file alone
+                return
+            updated["last_updated"] = datetime.now().isoformat()
+            _write_json(metadata_file, updated)
 
     def setup_github_repo(self, project_path: Path, repo_name: str = None, private: bool = True):
         """Set up GitHub repository for project"""
@@ -367,7 +556,7 @@ build/
 # Project specific
 .project-metadata.json
 """
-                gitignore_path.write_text(gitignore_content)
+                gitignore_path.write_bytes(gitignore_content.encode('utf-8'))
                 print("✅ .gitignore created")
             
             # Add all files
@@ -409,59 +598,78 @@ build/
 
     def _get_github_username(self) -> str:
         """Get GitHub username from git config"""
-        try:
-            result = subprocess.run(["git", "config", "user.name"], 
-                                  capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except:
-            return "your-username"
+        return _git_user_name()
 
     def list_projects(self, status: str = None, category: str = None):
         """List all projects with optional filtering"""
-        print("📋 Project Inventory")
-        print("=" * 50)
+        # Collect the listing and write it to stdout in one go
+        out = ["📋 Project Inventory\n", "=" * 50 + "\n"]
         
         status_dirs_to_check = [status] if status else self.status_dirs.keys()
+        categories_to_check = [category] if category else self.categories
+        layout = self._projects_by_location()
+        
+        metadata_by_project = self._load_all_metadata(
+            project
+            for status_name in status_dirs_to_check if status_name != "resources"
+            for cat in categories_to_check
+            for project in layout.get(status_name, {}).get(cat, [])
+        )
         
         for status_name in status_dirs_to_check:
             if status_name == "resources":
                 continue
                 
-            status_path = self.status_dirs[status_name]
-            if not status_path.exists():
+            if status_name not in layout:
                 continue
                 
-            print(f"\n🏷️  {status_name.upper().replace('_', ' ')}")
-            print("-" * 30)
-            
-            categories_to_check = [category] if category else self.categories
+            out.append(f"\n🏷️  {status_name.upper().replace('_', ' ')}\n")
+            out.append("-" * 30 + "\n")
             
             for cat in categories_to_check:
-                cat_path = status_path / cat
-                if not cat_path.exists():
-                    continue
-                    
-                projects = [p for p in cat_path.iterdir() if p.is_dir()]
+                projects = layout[status_name].get(cat)
                 if projects:
-                    print(f"\n  📁 {cat}:")
+                    out.append(f"\n  📁 {cat}:\n")
                     for project in sorted(projects):
-                        metadata_file = project / ".project-metadata.json"
-                        if metadata_file.exists():
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
+                        metadata = metadata_by_project[project]
+                        if metadata is not None:
                             desc = metadata.get('description', 'No description')[:50]
                             if len(desc) == 50:
                                 desc += "..."
-                            print(f"    • {project.name} - {desc}")
+                            out.append(f"    • {project.name} - {desc}\n")
                         else:
-                            print(f"    • {project.name}")
+                            out.append(f"    • {project.name}\n")
+        
+        sys.stdout.write(''.join(out))
+
+    def _load_metadata(self, project_path: Path) -> Tuple[Path, Optional[Dict]]:
+        """Read a project's .project-metadata.json; None if it has none"""
+        try:
+            return project_path, _read_json(project_path / ".project-metadata.json")
+        except FileNotFoundError:
+            return project_path, None
+
+    def _load_all_metadata(self, project_paths) -> Dict[Path, Optional[Dict]]:
+        """Read metadata for many projects at once, overlapping the file reads"""
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as executor:
+            return dict(executor.map(self._load_metadata, project_paths))
 
     def generate_project_report(self, output_file: str = None):
         """Generate comprehensive project report"""
         if output_file is None:
             output_file = self.desktop_path / f"Project_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
         
-        report_content = f"""# Project Portfolio Report
+        # Stream the report to disk as it is generated
+        with open(output_file, 'wb', buffering=REPORT_BUFFER_SIZE) as f:
+            for fragment in self._iter_report_lines():
+                f.write(fragment.encode('utf-8'))
+        
+        print(f"📊 Project report generated: {output_file}")
+        return output_file
+
+    def _iter_report_lines(self):
+        """Yield the project report as consecutive text fragments"""
+        yield f"""# Project Portfolio Report
 
 **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -473,16 +681,16 @@ build/
         status_counts = {}
         category_counts = {}
         total_projects = 0
+        layout = self._projects_by_location()
+        status_names = [status_name for status_name in self.status_dirs
+                        if status_name != "resources" and status_name in layout]
+        categories = self.categories
         
-        for status_name, status_path in self.status_dirs.items():
-            if status_name == "resources" or not status_path.exists():
-                continue
-                
+        for status_name in status_names:
             status_count = 0
-            for cat in self.categories:
-                cat_path = status_path / cat
-                if cat_path.exists():
-                    projects = [p for p in cat_path.iterdir() if p.is_dir()]
+            for cat in categories:
+                projects = layout[status_name].get(cat)
+                if projects is not None:
                     count = len(projects)
                     status_count += count
                     category_counts[cat] = category_counts.get(cat, 0) + count
@@ -490,63 +698,51 @@ build/
             status_counts[status_name] = status_count
             total_projects += status_count
         
-        report_content += f"**Total Projects**: {total_projects}\n\n"
+        yield f"**Total Projects**: {total_projects}\n\n"
         
         # Status breakdown
-        report_content += "### By Status\n"
+        yield "### By Status\n"
         for status, count in status_counts.items():
-            report_content += f"- **{status.replace('_', ' ').title()}**: {count}\n"
+            yield f"- **{status.replace('_', ' ').title()}**: {count}\n"
         
         # Category breakdown
-        report_content += "\n### By Category\n"
+        yield "\n### By Category\n"
         for category, count in sorted(category_counts.items()):
-            report_content += f"- **{category.replace('_', ' ')}**: {count}\n"
+            yield f"- **{category.replace('_', ' ')}**: {count}\n"
         
         # Detailed project listings
-        report_content += "\n## Detailed Project Listings\n\n"
+        yield "\n## Detailed Project Listings\n\n"
         
-        for status_name, status_path in self.status_dirs.items():
-            if status_name == "resources" or not status_path.exists():
-                continue
-                
-            report_content += f"### {status_name.replace('_', ' ').title()}\n\n"
+        metadata_by_project = self._load_all_metadata(
+            project
+            for status_name, categories in layout.items() if status_name != "resources"
+            for projects in categories.values()
+            for project in projects
+        )
+        
+        for status_name in status_names:
+            yield f"### {status_name.replace('_', ' ').title()}\n\n"
             
-            for cat in self.categories:
-                cat_path = status_path / cat
-                if not cat_path.exists():
-                    continue
-                    
-                projects = [p for p in cat_path.iterdir() if p.is_dir()]
+            for cat in categories:
+                projects = layout[status_name].get(cat)
                 if projects:
-                    report_content += f"#### {cat.replace('_', ' ')}\n\n"
+                    yield f"#### {cat.replace('_', ' ')}\n\n"
                     for project in sorted(projects):
-                        metadata_file = project / ".project-metadata.json"
-                        if metadata_file.exists():
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                            
-                            report_content += f"**{project.name}**\n"
-                            report_content += f"- Description: {metadata.get('description', 'No description')}\n"
-                            report_content += f"- Created: {metadata.get('created_date', 'Unknown')[:10]}\n"
-                            report_content += f"- Technologies: {', '.join(metadata.get('technologies', []))}\n"
+                        metadata = metadata_by_project[project]
+                        yield f"**{project.name}**\n"
+                        if metadata is not None:
+                            yield f"- Description: {metadata.get('description', 'No description')}\n"
+                            yield f"- Created: {metadata.get('created_date', 'Unknown')[:10]}\n"
+                            yield f"- Technologies: {', '.join(metadata.get('technologies', []))}\n"
                             if metadata.get('github_repo'):
-                                report_content += f"- GitHub: {metadata['github_repo']}\n"
-                            report_content += f"- Path: `{project}`\n\n"
-                        else:
-                            report_content += f"**{project.name}**\n"
-                            report_content += f"- Path: `{project}`\n\n"
-        
-        # Write report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
-        print(f"📊 Project report generated: {output_file}")
-        return output_file
-
+                                yield f"- GitHub: {metadata['github_repo']}\n"
+                        yield f"- Path: `{project}`\n\n"
 
 def main():
     parser = argparse.ArgumentParser(description="Project Management System")
     parser.add_argument("--base-path", help="Base path for project organization (default: ~/Desktop)")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="List every directory created and file copied")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
@@ -590,7 +786,7 @@ def main():
         return
     
     # Initialize project manager
-    pm = ProjectManager(args.base_path)
+    pm = ProjectManager(args.base_path, verbose=args.verbose)
     
     if args.command == "setup":
         pm.ensure_directory_structure()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Request rate limiting shared by the transcript extractors.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all workers so the overall request rate stays capped
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            # Sleeping under the lock queues the other workers behind this one
+            time.sleep((1 - self._tokens) / self.rate)
+            self._tokens = 0.0
+            self._last = time.monotonic()
@@ -9,9 +9,29 @@ import sys
 import json
 import time
 import argparse
+import importlib
+import importlib.util
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+CONFIG_FILE = "config.json"
+
+# Niceness added to the run so long extractions yield the CPU to interactive work
+NICE_INCREMENT = 10
+
+# Windows priority class equivalent to a positive nice value
+BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+
+# Exit status of a phase stopped with Ctrl-C (128 + SIGINT)
+EXIT_INTERRUPTED = 130
+
 def print_banner():
     """Print system banner."""
     print("=" * 70)
@@ -33,11 +53,11 @@ def check_dependencies():
     
     missing_modules = []
     
+    # Probe the import system without executing the modules
     for module in required_modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"  ✅ {module}")
-        except ImportError:
+        else:
             print(f"  ❌ {module} - MISSING")
             missing_modules.append(module)
     
@@ -49,18 +69,51 @@ def check_dependencies():
     print("✅ All dependencies satisfied\n")
     return True
 
+def lower_priority():
+    """Drop this process to background scheduling priority; in-process phases inherit it."""
+    try:
+        if hasattr(os, 'nice'):
+            os.nice(NICE_INCREMENT)
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), BELOW_NORMAL_PRIORITY_CLASS)
+    except (OSError, AttributeError) as e:
+        print(f"⚠️  Could not lower process priority: {e}")
+
+def run_phase(module_name, argv):
+    """Run a phase script's main() in this process; returns True if it exited cleanly.
+    
+    A phase stopped with Ctrl-C raises KeyboardInterrupt here, ending the workflow.
+    """
+    module = importlib.import_module(module_name)
+    
+    print(f"Running: {module_name}.main({' '.join(argv)})")
+    try:
+        module.main(argv)
+    except SystemExit as e:
+        if e.code == EXIT_INTERRUPTED:
+            raise KeyboardInterrupt from e
+        return not e.code
+    return True
+
+@lru_cache(maxsize=1)
+def load_config():
+    """Parse the configuration file once; later calls reuse the result."""
+    with open(CONFIG_FILE, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 def check_configuration():
     """Check configuration file."""
     print("🔧 Checking configuration...")
     
-    config_file = "config.json"
-    if not os.path.exists(config_file):
-        print(f"❌ Configuration file not found: {config_file}")
+    if not os.path.exists(CONFIG_FILE):
+        print(f"❌ Configuration file not found: {CONFIG_FILE}")
         return False
     
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = load_config()
         
         print(f"  ✅ Configuration loaded")
         print(f"  📁 Output directory: {config.get('output_directory', 'Not set')}")
@@ -90,21 +143,14 @@ def run_channel_discovery(api_key=None, max_videos=None):
         return True
     
     try:
-        import subprocess
-        
-        cmd = ["python", "channel_discovery.py", "--api-key", api_key]
+        argv = ["--api-key", api_key]
         if max_videos:
-            cmd.extend(["--max-videos", str(max_videos)])
+            argv.extend(["--max-videos", str(max_videos)])
         
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if run_phase("channel_discovery", argv):
             print("✅ Channel discovery completed successfully")
-            print(result.stdout)
         else:
             print("⚠️  Channel discovery failed (continuing anyway)")
-            print(result.stderr)
         
         print()
         return True
@@ -120,30 +166,18 @@ def run_transcript_extraction(max_videos=None, resume=True):
     print("-" * 35)
     
     try:
-        import subprocess
-        
-        cmd = ["python", "enhanced_youtube_extractor.py"]
+        argv = []
         if max_videos:
-            cmd.extend(["--max-videos", str(max_videos)])
+            argv.extend(["--max-videos", str(max_videos)])
         if not resume:
-            cmd.append("--no-resume")
+            argv.append("--no-resume")
         
-        print(f"Running: {' '.join(cmd)}")
         print("This may take a while for large channels...\n")
         
-        # Run with real-time output
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                 universal_newlines=True, bufsize=1)
-        
-        for line in process.stdout:
-            print(line.rstrip())
-        
-        process.wait()
-        
-        if process.returncode == 0:
+        if run_phase("enhanced_youtube_extractor", argv):
             print("\n✅ Transcript extraction completed successfully")
         else:
-            print(f"\n❌ Transcript extraction failed with code {process.returncode}")
+            print("\n❌ Transcript extraction failed")
             return False
         
         print()
@@ -159,19 +193,10 @@ def run_content_organization():
     print("-" * 33)
     
     try:
-        import subprocess
-        
-        cmd = ["python", "content_organizer.py", "--all"]
-        
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if run_phase("content_organizer", ["--all"]):
             print("✅ Content organization completed successfully")
-            print(result.stdout)
         else:
             print("⚠️  Content organization had issues")
-            print(result.stderr)
         
         print()
         return True
@@ -180,6 +205,51 @@ def run_content_organization():
         print(f"⚠️  Content organization error: {e}")
         return True  # Non-critical, continue
 
+def iter_files(root):
+    """Yield a DirEntry for every file under root, reusing scandir's cached stat data."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+def scan_output_dir(output_dir):
+    """Tally the output tree in one scandir pass.
+    
+    Returns (transcripts, json files, csv files, transcript bytes, Counter of transcripts
+    per top-level directory other than Logs/Reports). Only transcripts are stat'ed.
+    """
+    txt_count = json_count = csv_count = 0
+    total_size = 0
+    tractate_counts = Counter()
+    with os.scandir(output_dir) as it:
+        for top in it:
+            is_dir = top.is_dir(follow_symlinks=False)
+            if is_dir:
+                entries = iter_files(top.path)
+            elif top.is_file():
+                entries = (top,)
+            else:
+                continue
+            
+            dir_txt_count = 0
+            for entry in entries:
+                name = entry.name
+                if name.endswith(('.txt', '.txt.gz')):
+                    dir_txt_count += 1
+                    total_size += entry.stat().st_size
+                elif name.endswith('.json'):
+                    json_count += 1
+                elif name.endswith('.csv'):
+                    csv_count += 1
+            txt_count += dir_txt_count
+            
+            if is_dir and top.name not in ('Logs', 'Reports'):
+                tractate_counts[top.name] += dir_txt_count
+    
+    return txt_count, json_count, csv_count, total_size, tractate_counts
+
 def generate_final_report():
     """Generate final extraction report."""
     print("📊 Phase 4: Final Report Generation")
@@ -187,9 +257,7 @@ def generate_final_report():
     
     try:
         # Check output directory
-        config_file = "config.json"
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = load_config()
         
         output_dir = Path(config.get('output_directory', 'Mercaz_Daf_Yomi_Transcripts'))
         
@@ -197,13 +265,8 @@ def generate_final_report():
             print("⚠️  Output directory not found")
             return False
         
-        # Count files
-        transcript_files = list(output_dir.rglob('*.txt'))
-        json_files = list(output_dir.rglob('*.json'))
-        csv_files = list(output_dir.rglob('*.csv'))
-        
-        # Calculate total size
-        total_size = sum(f.stat().st_size for f in transcript_files if f.exists())
+        # Count files, total transcript size and per-tractate transcripts in a single pass
+        txt_count, json_count, csv_count, total_size, tractate_counts = scan_output_dir(output_dir)
         total_size_mb = total_size / (1024 * 1024)
         
         # Generate summary
@@ -217,25 +280,23 @@ def generate_final_report():
             
             f.write("FILE SUMMARY:\n")
             f.write("-" * 15 + "\n")
-            f.write(f"Transcript files (.txt): {len(transcript_files)}\n")
-            f.write(f"JSON files: {len(json_files)}\n")
-            f.write(f"CSV files: {len(csv_files)}\n")
+            f.write(f"Transcript files (.txt/.txt.gz): {txt_count}\n")
+            f.write(f"JSON files: {json_count}\n")
+            f.write(f"CSV files: {csv_count}\n")
             f.write(f"Total content size: {total_size_mb:.1f} MB\n\n")
             
             f.write("DIRECTORY STRUCTURE:\n")
             f.write("-" * 20 + "\n")
             
             # List tractate directories
-            for item in sorted(output_dir.iterdir()):
-                if item.is_dir() and item.name not in ['Logs', 'Reports']:
-                    series_count = len([f for f in item.rglob('*.txt')])
-                    f.write(f"{item.name}: {series_count} files\n")
+            for name, series_count in sorted(tractate_counts.items()):
+                f.write(f"{name}: {series_count} files\n")
         
         print(f"✅ Final report generated: {report_file}")
         
         # Print summary to console
         print("\n📊 EXTRACTION SUMMARY:")
-        print(f"   📄 Transcript files: {len(transcript_files)}")
+        print(f"   📄 Transcript files: {txt_count}")
         print(f"   💾 Total size: {total_size_mb:.1f} MB")
         print(f"   📁 Output directory: {output_dir}")
         
@@ -281,6 +342,12 @@ def main():
         help='Run in test mode (max 10 videos, all phases)'
     )
     
+    parser.add_argument(
+        '--normal-priority',
+        action='store_true',
+        help='Keep normal CPU priority (by default the workflow runs at background priority)'
+    )
+    
     args = parser.parse_args()
     
     # Test mode overrides
@@ -290,6 +357,9 @@ def main():
     
     print_banner()
     
+    if not args.normal_priority:
+        lower_priority()
+    
     # Pre-flight checks
     if not check_dependencies():
         sys.exit(1)
@@ -298,8 +368,7 @@ def main():
         sys.exit(1)
     
     # Load configuration
-    with open('config.json', 'r') as f:
-        config = json.load(f)
+    config = load_config()
     
     api_key = config.get('youtube_api_key')
     
@@ -1,5 +1,24 @@
 # Create a comparison table of different YouTube transcript extraction methods
-import pandas as pd
+import csv
+
+def table_rows(table):
+    """Turn a dict of columns into a list of row dicts"""
+    return [dict(zip(table, values)) for values in zip(*table.values())]
+
+def table_to_string(table):
+    """Render a dict of columns as right-aligned text columns"""
+    widths = [max(len(name), *(len(str(value)) for value in column)) for name, column in table.items()]
+    lines = [" ".join(name.rjust(width) for name, width in zip(table, widths))]
+    for values in zip(*table.values()):
+        lines.append(" ".join(str(value).rjust(width) for value, width in zip(values, widths)))
+    return "\n".join(lines)
+
+def save_table_csv(table, path):
+    """Write a dict of columns to a CSV file with a header row"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(table), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(table_rows(table))
 
 # Create comparison data
 comparison_data = {
@@ -95,16 +114,13 @@ comparison_data = {
     ]
 }
 
-# Create DataFrame
-df = pd.DataFrame(comparison_data)
-
 # Display the comparison table
 print("YouTube Transcript Extraction Methods Comparison")
 print("=" * 70)
-print(df.to_string(index=False))
+print(table_to_string(comparison_data))
 
 # Save to CSV
-df.to_csv('transcript_methods_comparison.csv', index=False)
+save_table_csv(comparison_data, 'transcript_methods_comparison.csv')
 print("\nComparison saved to: transcript_methods_comparison.csv")
 
 # Create a detailed pros and cons analysis
@@ -139,15 +155,14 @@ pros_cons_data = {
     ]
 }
 
-pros_cons_df = pd.DataFrame(pros_cons_data)
 print("\n\nDetailed Pros and Cons Analysis")
 print("=" * 50)
-for index, row in pros_cons_df.iterrows():
+for row in table_rows(pros_cons_data):
     print(f"\n{row['Method']}")
     print(f"Pros: {row['Pros']}")
     print(f"Cons: {row['Cons']}")
     print(f"Best for: {row['Recommended Use Case']}")
 
 # Save pros and cons to CSV
-pros_cons_df.to_csv('transcript_methods_pros_cons.csv', index=False)
+save_table_csv(pros_cons_data, 'transcript_methods_pros_cons.csv')
 print("\nPros and cons analysis saved to: transcript_methods_pros_cons.csv")
\ No newline at end of file
@@ -3,15 +3,150 @@
 # This script demonstrates how to extract transcripts from YouTube videos
 
 import os
+import re
 import csv
-from youtube_transcript_api import YouTubeTranscriptApi
+import gzip
+import json
+import argparse
+import functools
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from urllib.parse import urlparse, parse_qs
-import time
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api import YouTubeTranscriptApi
+
+from rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Number of videos fetched concurrently (the work is network-bound)
+MAX_WORKERS = 8
+
+# Seconds between transcript requests across all workers, unless config.json sets
+# rate_limit_seconds
+REQUEST_INTERVAL = 1.0
+
+# Requests that may go out back to back after the fetchers have been idle
+RATE_LIMIT_BURST = 1
+
+# Keep-alive pool shared by every transcript request (sized above MAX_WORKERS)
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# gzip level for saved transcripts (6 trades a little size for much faster writes than 9)
+TRANSCRIPT_COMPRESSLEVEL = 6
+
+# Characters dropped from titles when building filenames (keeps letters, digits, _, space, -)
+_SAFE_RE = re.compile(r'[^\w \-]')
+
+# 11-character video ID in watch (?v=), youtu.be/ and /embed/ URLs
+_VID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])')
+
+# Columns of the results CSV, written a row at a time as videos finish
+RESULT_FIELDS = ['title', 'video_id', 'url', 'transcript_file', 'transcript_length', 'status']
+RESULTS_BUFFER_SIZE = 1 << 20
+
+# Previously fetched transcripts, stored as <video_id>.json.gz
+CACHE_DIR = os.path.join('.cache', 'transcripts')
+
+def load_rate_limit(config_file='config.json'):
+    """
+    Seconds between transcript requests: rate_limit_seconds from config_file, if it exists
+    """
+    try:
+        with open(config_file, 'rb') as f:
+            config = _json_loads(f.read())
+        return float(config.get('rate_limit_seconds', REQUEST_INTERVAL))
+    except (OSError, ValueError, TypeError):
+        return REQUEST_INTERVAL
+
+def build_transcript_api():
+    """
+    Create one transcript client whose HTTPS connections are reused across all videos of a run
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                                          pool_maxsize=HTTP_POOL_MAXSIZE))
+    return YouTubeTranscriptApi(http_client=session)
+
+def _json_loads(data):
+    """
+    Parse JSON bytes, using orjson when it is installed
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_bytes(data):
+    """
+    Serialize data as UTF-8 JSON, using orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def disk_memoize(cachedir):
+    """
+    Cache a video's transcript entries on disk so re-runs skip the network
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(video_id, *args, **kwargs):
+            if not wrapper.use_cache:
+                return func(video_id, *args, **kwargs)
+
+            path = os.path.join(cachedir, f"{video_id}.json.gz")
+            try:
+                with gzip.open(path, 'rb') as f:
+                    transcript_data = _json_loads(f.read())
+                return transcript_to_text(transcript_data), transcript_data
+            except (OSError, EOFError, zlib.error, ValueError):
+                # Missing, truncated or corrupt cache file: fetch from the network instead
+                pass
+
+            full_text, transcript_data = func(video_id, *args, **kwargs)
+
+            # Only successful fetches are cached; failures are retried next run
+            if full_text:
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    os.makedirs(cachedir, exist_ok=True)
+                    with gzip.open(tmp_path, 'wb') as f:
+                        f.write(_json_bytes(transcript_data))
+                    os.replace(tmp_path, path)
+                except OSError as e:
+                    print(f"Warning: could not cache transcript for {video_id}: {e}")
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+
+            return full_text, transcript_data
+
+        wrapper.use_cache = True
+        return wrapper
+    return decorator
+
+def transcript_to_text(transcript_data):
+    """
+    Join transcript entries into plain text
+    """
+    return " ".join(entry['text'] for entry in transcript_data).strip()
 
 def extract_video_id(url):
     """
     Extract video ID from a YouTube URL
     """
+    match = _VID_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # Fall back to full URL parsing for IDs the fast pattern doesn't cover
     parsed_url = urlparse(url)
     if parsed_url.hostname == 'youtu.be':
         return parsed_url.path[1:]
@@ -22,13 +157,18 @@ def extract_video_id(url):
             return parsed_url.path.split('/')[2]
     return None
 
-def extract_transcript(video_id):
+@disk_memoize(CACHE_DIR)
+def extract_transcript(video_id, transcript_api, bucket=None):
     """
-    Extract transcript for a single video
+    Extract transcript for a single video with transcript_api, waiting on bucket (if given)
+    before any request
     """
     try:
+        if bucket is not None:
+            bucket.acquire()
+
         # Get available transcripts
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcript_list = transcript_api.list(video_id)
 
         # Try to get English transcript first
         try:
@@ -37,86 +177,133 @@ def extract_transcript(video_id):
             # If English not available, get first available transcript
             transcript = transcript_list.find_transcript(['en-US', 'en-GB', 'auto'])
 
-        # Fetch the transcript
-        transcript_data = transcript.fetch()
+        # Fetch the transcript as a list of {'text', 'start', 'duration'} dicts
+        transcript_data = transcript.fetch().to_raw_data()
 
         # Convert to plain text
-        full_text = ""
-        for entry in transcript_data:
-            full_text += entry['text'] + " "
-
-        return full_text.strip(), transcript_data
+        return transcript_to_text(transcript_data), transcript_data
 
     except Exception as e:
         print(f"Error extracting transcript for {video_id}: {str(e)}")
         return None, None
 
-def save_transcript(video_id, title, transcript_text, transcript_data):
+def save_transcript(video_id, title, transcript_text, transcript_data, compress=True):
     """
-    Save transcript to a text file
+    Save transcript to a text file (gzip-compressed .txt.gz unless compress is False)
     """
     # Create filename (sanitize title for filesystem)
-    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_title = _SAFE_RE.sub('', title).rstrip()
     filename = f"{safe_title}_{video_id}.txt"
 
-    # Write to file
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"Video: {title}\n")
-        f.write(f"Video ID: {video_id}\n")
-        f.write(f"URL: https://www.youtube.com/watch?v={video_id}\n")
-        f.write("-" * 50 + "\n\n")
-        f.write(transcript_text)
+    content = (
+        f"Video: {title}\n"
+        f"Video ID: {video_id}\n"
+        f"URL: https://www.youtube.com/watch?v={video_id}\n"
+        f"{'-' * 50}\n\n"
+        f"{transcript_text}"
+    )
+
+    # Write header and transcript in a single call
+    if compress:
+        filename += '.gz'
+        with gzip.open(filename, 'wt', encoding='utf-8', compresslevel=TRANSCRIPT_COMPRESSLEVEL) as f:
+            f.write(content)
+    else:
+        Path(filename).write_text(content, encoding='utf-8')
 
     return filename
 
-def process_video_list(video_urls_and_titles):
-    """
-    Process a list of YouTube videos
-    """
-    results = []
-
-    for url, title in video_urls_and_titles:
-        print(f"Processing: {title}")
-
-        # Extract video ID
-        video_id = extract_video_id(url)
-        if not video_id:
-            print(f"  Error: Could not extract video ID from {url}")
-            continue
-
-        # Extract transcript
-        transcript_text, transcript_data = extract_transcript(video_id)
-
-        if transcript_text:
-            # Save to file
-            filename = save_transcript(video_id, title, transcript_text)
-            results.append({
-                'title': title,
-                'video_id': video_id,
-                'url': url,
-                'transcript_file': filename,
-                'transcript_length': len(transcript_text),
-                'status': 'success'
-            })
-            print(f"  Success: Saved to {filename}")
-        else:
-            results.append({
-                'title': title,
-                'video_id': video_id,
-                'url': url,
-                'transcript_file': None,
-                'transcript_length': 0,
-                'status': 'failed'
-            })
-            print(f"  Failed: Could not extract transcript")
-
-        # Rate limiting - wait 1 second between requests
-        time.sleep(1)
-
-    return results
+def _fetch_one(url, title, transcript_api, bucket, compress):
+    """
+    Fetch and save the transcript for a single video
+    """
+    print(f"Processing: {title}")
+
+    # Extract video ID
+    video_id = extract_video_id(url)
+    if not video_id:
+        print(f"  Error: Could not extract video ID from {url}")
+        return None
+
+    # Extract transcript; cache hits skip the shared rate limit
+    transcript_text, transcript_data = extract_transcript(video_id, transcript_api, bucket)
+
+    if transcript_text:
+        # Save to file
+        filename = save_transcript(video_id, title, transcript_text, transcript_data, compress)
+        return {
+            'title': title,
+            'video_id': video_id,
+            'url': url,
+            'transcript_file': filename,
+            'transcript_length': len(transcript_text),
+            'status': 'success'
+        }
+
+    return {
+        'title': title,
+        'video_id': video_id,
+        'url': url,
+        'transcript_file': None,
+        'transcript_length': 0,
+        'status': 'failed'
+    }
+
+def process_video_list(video_urls_and_titles, max_workers=MAX_WORKERS, compress=True, results_file=None,
+                       rate_limit_seconds=None):
+    """
+    Process a list of YouTube videos concurrently, streaming each result to results_file if given
+    """
+    results = [None] * len(video_urls_and_titles)
+
+    if rate_limit_seconds is None:
+        rate_limit_seconds = load_rate_limit()
+    bucket = TokenBucket(1 / rate_limit_seconds, RATE_LIMIT_BURST) if rate_limit_seconds > 0 else None
+    transcript_api = build_transcript_api()
+
+    with ExitStack() as stack:
+        writer = None
+        if results_file:
+            f = stack.enter_context(open(results_file, 'w', newline='', encoding='utf-8',
+                                         buffering=RESULTS_BUFFER_SIZE))
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        futures = {
+            executor.submit(_fetch_one, url, title, transcript_api, bucket, compress): index
+            for index, (url, title) in enumerate(video_urls_and_titles)
+        }
+
+        # Only this thread writes rows, so the CSV needs no lock
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                continue
+
+            # Keep results in input order regardless of completion order
+            results[futures[future]] = result
+            if writer is not None:
+                writer.writerow(result)
+            if result['status'] == 'success':
+                print(f"  Success: {result['title']} saved to {result['transcript_file']}")
+            else:
+                print(f"  Failed: Could not extract transcript for {result['title']}")
+
+    return [result for result in results if result is not None]
 
 # Example usage with the Daf Yomi videos
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YouTube transcript extraction demo")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Always fetch from YouTube instead of reusing transcripts in {CACHE_DIR}')
+    parser.add_argument('--no-compress', action='store_true',
+                        help='Save transcripts as plain .txt instead of gzip-compressed .txt.gz')
+    args = parser.parse_args()
+
+    if args.no_cache:
+        extract_transcript.use_cache = False
+
     # Sample video list (first 5 videos from the playlist)
     sample_videos = [
         ("https://youtube.com/watch?v=l_JBZsSR7Tk", "Daf Yomi Berachos Daf 2 by R' Eli Stefansky"),
@@ -129,14 +316,9 @@ if __name__ == "__main__":
     print("YouTube Transcript Extraction Demo")
     print("=" * 40)
 
-    # Process the sample videos
-    results = process_video_list(sample_videos)
-
-    # Create summary CSV
-    with open('transcript_extraction_results.csv', 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'video_id', 'url', 'transcript_file', 'transcript_length', 'status'])
-        writer.writeheader()
-        writer.writerows(results)
+    # Process the sample videos, writing the summary CSV as each one finishes
+    results = process_video_list(sample_videos, compress=not args.no_compress,
+                                 results_file='transcript_extraction_results.csv')
 
     print("\nSummary:")
     print(f"Total videos processed: {len(results)}")